@@ -0,0 +1,213 @@
+"""Benchmarks the analysis hot paths, checks golden outputs and gates on regressions.
+
+    python benchmarks/bench_hot_paths.py                        # golden check + timings
+    python benchmarks/bench_hot_paths.py --save-baseline        # store timings as the baseline
+    python benchmarks/bench_hot_paths.py --compare              # fail if slower than the baseline
+    python benchmarks/bench_hot_paths.py --update-golden        # after an intended output change
+
+Timed: scale_generator, find_possible_scales for 1-12 input notes with and without a style's
+allowed_scales, chords_in_scale, the adaptation-building path show_results runs (cold and
+cached) for every style, and a cold `import indienizer`. Each timing is the median of several
+repeats, in microseconds per call; the repeats are taken in rounds over all paths.
+
+The golden check runs first: digests of every scale, chord and adaptation result over a fixed
+set of inputs must match benchmarks/golden.json, so an optimization can't change the output.
+Timings are machine-specific, so the baseline (benchmarks/baseline.json) isn't committed;
+save one on the base revision and compare on the change under test. --compare only flags a
+path whose fastest repeat is still both --threshold (relative) and --min-delta (absolute)
+slower than the baseline's median, so drift on a busy machine and jitter on the quickest paths
+don't fail the gate. The import, which spawns interpreters, gets a looser --import-threshold.
+Flagged paths are timed again (--retries) and fail only if they stay slow.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from indienizer import core
+
+GOLDEN_PATH = os.path.join(HERE, "golden.json")
+BASELINE_PATH = os.path.join(HERE, "baseline.json")
+STYLES = [None] + list(core.style_scales)
+
+def note_sets(size, limit=24):
+    """A fixed spread of note sets of one size: every k-th 12-choose-size combination."""
+    combos = list(itertools.combinations(core.notes_list, size))
+    step = max(1, len(combos) // limit)
+    return [list(combo) for combo in combos[::step][:limit]]
+
+def digest(obj):
+    return hashlib.sha256(json.dumps(obj, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+def golden_outputs():
+    """Digests of every hot path's output over the fixed inputs."""
+    outputs = {}
+    for scale_type in core.scale_patterns:
+        scales = [core.scale_generator(root, scale_type) for root in core.notes_list]
+        outputs[f"scale_generator/{scale_type}"] = digest(scales)
+        outputs[f"chords_in_scale/{scale_type}"] = digest([core.chords_in_scale(s, scale_type) for s in scales])
+    for style in STYLES:
+        allowed = core.style_scales.get(style)
+        for size in range(0, len(core.notes_list) + 1):
+            sets = note_sets(size)
+            outputs[f"find_possible_scales/{style or 'all'}/{size}"] = digest(
+                [core.find_possible_scales(notes, allowed) for notes in sets])
+            outputs[f"analyze_notes/{style or 'all'}/{size}"] = digest(
+                [core.analyze_notes(notes, style) for notes in sets])
+    return outputs
+
+def check_golden(update=False):
+    """Compares golden_outputs() with the stored file; returns the names that differ."""
+    outputs = golden_outputs()
+    if update or not os.path.exists(GOLDEN_PATH):
+        with open(GOLDEN_PATH, "w") as f:
+            json.dump(outputs, f, indent=1, sort_keys=True)
+            f.write("\n")
+        return []
+    with open(GOLDEN_PATH) as f:
+        expected = json.load(f)
+    return sorted(name for name in expected.keys() | outputs.keys() if expected.get(name) != outputs.get(name))
+
+def sampler(fn, per_call=1):
+    """A function timing one batch of fn calls, in microseconds per call (divided by per_call)."""
+    timer = timeit.Timer(fn)
+    number = None
+    def sample():
+        nonlocal number
+        if number is None:
+            number, _ = timer.autorange()
+        return timer.timeit(number) / number / per_call * 1e6
+    return sample
+
+def import_sample():
+    """One cold `import indienizer` in a fresh interpreter, in microseconds."""
+    code = "import time; t = time.perf_counter(); import indienizer; print(time.perf_counter() - t)"
+    return float(subprocess.check_output([sys.executable, "-c", code], cwd=os.path.dirname(HERE))) * 1e6
+
+def benchmark_cases():
+    """{name: sampler for that path}."""
+    cases = {"import/indienizer": import_sample}
+    cases["scale_generator/all"] = sampler(
+        lambda: [core.scale_generator(r, t) for r in core.notes_list for t in core.scale_patterns])
+    scales = [(core.scale_generator(r, t), t) for r in core.notes_list for t in core.chord_types_map]
+    cases["chords_in_scale/all"] = sampler(lambda: [core.chords_in_scale(s, t) for s, t in scales])
+
+    style_allowed = core.style_scales["Bon Iver"]
+    for size in range(1, len(core.notes_list) + 1):
+        sets = note_sets(size)
+        cases[f"find_possible_scales/{size}_notes"] = sampler(
+            lambda sets=sets: [core.find_possible_scales(notes) for notes in sets], len(sets))
+        cases[f"find_possible_scales/{size}_notes/allowed"] = sampler(
+            lambda sets=sets: [core.find_possible_scales(notes, style_allowed) for notes in sets], len(sets))
+
+    adapt_sets = note_sets(3, limit=8)
+    for style in core.style_scales:
+        def adapt(style=style):
+            return [core.analyze_notes(notes, style) for notes in adapt_sets]
+        def adapt_cold(style=style):
+            core.invalidate_adaptation_cache()
+            return adapt(style)
+        cases[f"adaptations/{style}"] = sampler(adapt, len(adapt_sets))
+        cases[f"adaptations_cold/{style}"] = sampler(adapt_cold, len(adapt_sets))
+    return cases
+
+def run_benchmarks(names=None, repeat=7):
+    """{name: [repeat timings]} for every case (or those in names), in microseconds per call.
+
+    Each round samples every case once, so a path's repeats are spread over the whole run
+    rather than taken back to back, and a slow spell on the machine can't skew just one path.
+    """
+    cases = {name: case for name, case in benchmark_cases().items() if names is None or name in names}
+    samples = {name: [] for name in cases}
+    for _ in range(repeat):
+        for name, case in cases.items():
+            samples[name].append(case())
+    return samples
+
+def compare(results, baseline, threshold, min_delta=0.0, import_threshold=None):
+    """Returns [(name, baseline us, current us, ratio)] for paths slower than baseline * (1 + threshold)
+    and by more than min_delta us; import/ paths use import_threshold when given.
+
+    --compare passes each path's fastest repeat as results and the baseline's medians, so a
+    path only fails when every repeat was slow, which drift on a busy machine rarely causes.
+    """
+    regressions = []
+    for name, before in baseline.items():
+        after = results.get(name)
+        limit = import_threshold if import_threshold is not None and name.startswith("import/") else threshold
+        if after is not None and before > 0 and after > before * (1 + limit) and after - before > min_delta:
+            regressions.append((name, before, after, after / before))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="also write the results JSON here")
+    parser.add_argument("--save-baseline", nargs="?", const=BASELINE_PATH, metavar="PATH")
+    parser.add_argument("--compare", nargs="?", const=BASELINE_PATH, metavar="PATH")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before --compare fails (default: 0.25 = 25%%)")
+    parser.add_argument("--min-delta", type=float, default=2.0, metavar="US",
+                        help="ignore slowdowns smaller than this many microseconds per call (default: 2)")
+    parser.add_argument("--import-threshold", type=float, default=1.0,
+                        help="allowed slowdown of import/indienizer (default: 1.0 = 100%%)")
+    parser.add_argument("--retries", type=int, default=3,
+                        help="times --compare re-measures flagged paths before failing (default: 3)")
+    parser.add_argument("--update-golden", action="store_true")
+    parser.add_argument("--golden-only", action="store_true", help="skip the timings")
+    args = parser.parse_args(argv)
+
+    mismatches = check_golden(args.update_golden)
+    if mismatches:
+        print("golden output mismatch:\n  " + "\n  ".join(mismatches), file=sys.stderr)
+        return 1
+    print("golden outputs: ok", file=sys.stderr)
+    if args.golden_only:
+        return 0
+
+    samples = run_benchmarks()
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "unit": "us_per_call",
+        "results": {name: statistics.median(times) for name, times in samples.items()},
+        "fastest": {name: min(times) for name, times in samples.items()},
+    }
+    json.dump(report, sys.stdout, indent=1, sort_keys=True)
+    sys.stdout.write("\n")
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=1, sort_keys=True)
+                f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        fastest = report["fastest"]
+        regressions = compare(fastest, baseline, args.threshold, args.min_delta, args.import_threshold)
+        # A real slowdown shows up on every run; re-time the flagged paths and keep their best
+        for _ in range(args.retries):
+            if not regressions:
+                break
+            for name, times in run_benchmarks({r[0] for r in regressions}).items():
+                fastest[name] = min([fastest[name]] + times)
+            regressions = compare(fastest, baseline, args.threshold, args.min_delta, args.import_threshold)
+        for name, before, after, ratio in regressions:
+            print(f"REGRESSION {name}: {before:.1f} -> {after:.1f} us ({ratio:.2f}x)", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
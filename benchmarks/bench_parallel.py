@@ -0,0 +1,52 @@
+"""Measures batch-analysis throughput and speedup for 1..N worker processes.
+
+    python benchmarks/bench_parallel.py [--lines 20000] [--max-workers 8]
+
+Each run analyzes the same synthetic note sets; output is checked to be identical
+to the single-process run, so the speedup numbers compare equal work.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indienizer.cli import analyze_parallel, analyze_stream, encode_results
+from indienizer.core import notes_list, style_scales
+
+def make_note_sets(count, seed=0):
+    """Random 1-7 note sets over every style, so the workload resembles a catalogue."""
+    rng = random.Random(seed)
+    styles = list(style_scales)
+    return [(rng.sample(notes_list, rng.randint(1, 7)), rng.choice(styles)) for _ in range(count)]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    note_sets = make_note_sets(args.lines)
+
+    start = time.perf_counter()
+    expected = list(encode_results(analyze_stream(note_sets)))
+    baseline = time.perf_counter() - start
+    print(f"cpu cores: {os.cpu_count()}  lines: {args.lines}")
+    print(f"{'workers':>7} {'seconds':>9} {'lines/s':>10} {'speedup':>8}")
+    print(f"{'serial':>7} {baseline:9.3f} {args.lines / baseline:10.0f} {1.0:8.2f}")
+
+    counts = sorted({2 ** i for i in range(args.max_workers.bit_length())} | {args.max_workers})
+    for workers in counts:
+        start = time.perf_counter()
+        lines = list(analyze_parallel(note_sets, workers, args.chunk_size))
+        elapsed = time.perf_counter() - start
+        if lines != expected:
+            sys.exit(f"output with {workers} workers differs from the serial run")
+        print(f"{workers:>7} {elapsed:9.3f} {args.lines / elapsed:10.0f} {baseline / elapsed:8.2f}")
+
+if __name__ == "__main__":
+    main()
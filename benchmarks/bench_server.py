@@ -0,0 +1,136 @@
+"""Local load generator for the analysis service: latency percentiles under concurrent load.
+
+    python benchmarks/bench_server.py [--requests 5000] [--concurrency 64] [--batch 0]
+
+Starts the server in a separate process on a free port (or targets --port of a running one),
+opens --concurrency keep-alive connections and fires requests drawn from a random catalogue of
+note sets, so the cache sees a realistic mix of repeats and new keys. --batch N sends N note
+sets per /batch request instead of one per /analyze request.
+
+Keeping the server in its own process means the client side's scheduling and JSON work don't
+count towards the latencies. --in-process runs it in the clients' event loop instead, which
+is handy for profiling both halves together but overstates server latency.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from indienizer.core import notes_list, style_scales
+from indienizer.server import AnalysisServer
+
+def make_catalogue(size, seed=0):
+    rng = random.Random(seed)
+    styles = list(style_scales)
+    return [{"notes": rng.sample(notes_list, rng.randint(1, 7)), "style": rng.choice(styles)} for _ in range(size)]
+
+async def client(port, payloads, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for path, body in payloads:
+            start = time.perf_counter()
+            writer.write(
+                f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+            )
+            await writer.drain()
+            status = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            if b" 200 " not in status:
+                raise RuntimeError(f"{path} failed: {status!r}")
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+async def get_json(port, path):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode("latin-1"))
+        response = await reader.read()
+    finally:
+        writer.close()
+    return json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+def start_server_process():
+    """Runs `python -m indienizer.server --port 0` and returns (process, port) once it listens."""
+    process = subprocess.Popen([sys.executable, "-u", "-m", "indienizer.server", "--port", "0"],
+                               cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()  # "INDIENIZER analysis service on 127.0.0.1:PORT"
+    if not line:
+        process.wait()
+        raise RuntimeError("the server process exited before listening")
+    return process, int(line.rsplit(":", 1)[1])
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+async def run(args):
+    server = process = None
+    port = args.port
+    if port is None and args.in_process:
+        app = AnalysisServer()
+        server = await app.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+    elif port is None:
+        process, port = start_server_process()
+
+    rng = random.Random(1)
+    catalogue = make_catalogue(args.catalogue)
+    payloads = []
+    for _ in range(args.requests):
+        if args.batch:
+            items = [rng.choice(catalogue) for _ in range(args.batch)]
+            payloads.append(("/batch", json.dumps({"items": items}).encode()))
+        else:
+            payloads.append(("/analyze", json.dumps(rng.choice(catalogue)).encode()))
+
+    latencies = []
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(client(port, payloads[i::args.concurrency], latencies) for i in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+        cache = (await get_json(port, "/health"))["cache"]
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    latencies.sort()
+    print(f"requests: {len(latencies)}  concurrency: {args.concurrency}  note sets/request: {args.batch or 1}")
+    print(f"throughput: {len(latencies) / elapsed:.0f} req/s over {elapsed:.2f} s")
+    print("latency ms: " + "  ".join(
+        f"p{int(q * 100)}={percentile(latencies, q) * 1000:.2f}" for q in (0.5, 0.9, 0.99)
+    ) + f"  max={latencies[-1] * 1000:.2f}")
+    print(f"cache: {cache}")
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--batch", type=int, default=0, help="note sets per /batch request (0 = use /analyze)")
+    parser.add_argument("--catalogue", type=int, default=2000, help="distinct note sets to draw from")
+    parser.add_argument("--port", type=int, help="target an already running server instead")
+    parser.add_argument("--in-process", action="store_true",
+                        help="run the server in the load generator's own event loop (latencies include client work)")
+    asyncio.run(run(parser.parse_args(argv)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""INDIENIZER analysis package. Importing it never touches tkinter."""
+
+from indienizer.core import (
+    adaptation_cache_info,
+    adaptation_table,
+    analyze_notes,
+    artist_borrow_weights,
+    artist_borrowed_chords_data,
+    artist_extensions_data,
+    chord_types_map,
+    chords_in_scale,
+    extension_compatibility,
+    find_possible_scales,
+    invalidate_adaptation_cache,
+    note_to_index_map,
+    notes_list,
+    notes_to_mask,
+    scale_generator,
+    scale_patterns,
+    style_scales,
+)
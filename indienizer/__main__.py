@@ -0,0 +1,5 @@
+import sys
+
+from indienizer.cli import main
+
+sys.exit(main())
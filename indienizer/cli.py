@@ -0,0 +1,226 @@
+"""Command-line batch mode: analyze note sets from files or stdin, one per line.
+
+Accepted input lines:
+  text   C E G A            (notes separated by spaces or commas)
+  jsonl  {"notes": ["C", "E", "G"], "style": "Bon Iver"}   ("notes" may also be a string)
+  csv    notes,style         (header row; notes separated by spaces)
+
+Results are streamed out as JSONL, one object per input line, in input order.
+Everything is generator-based, so memory stays flat no matter how long the input is.
+With --workers, chunks of input are analyzed in a process pool; output order is unchanged.
+"""
+
+import argparse
+import cProfile
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from indienizer import profiling
+from indienizer.core import analyze_notes, style_scales
+from indienizer.registry import load_registry
+
+INPUT_FORMATS = ("auto", "text", "jsonl", "csv")
+NO_NOTES = "no notes given"
+
+def split_notes(text):
+    """Splits "C E G" / "C,E,G" into note names."""
+    return text.replace(",", " ").split()
+
+def read_note_sets(lines, fmt="auto", default_style=None):
+    """Yields (notes, style) for every non-blank input line.
+
+    With fmt="auto", lines starting with "{" are read as JSON and everything else as text.
+    A line that can't be used (bad JSON, not an object, wrong field types, no notes) is yielded
+    as a ready-made {"line", "error"} result instead, so one bad line doesn't stop the stream.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            notes = split_notes(row.get("notes") or "")
+            style = (row.get("style") or "").strip() or default_style
+            yield (notes, style) if notes else {"line": reader.line_num, "error": NO_NOTES}
+        return
+
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if fmt == "jsonl" or (fmt == "auto" and line.startswith("{")):
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield {"line": line_number, "error": f"invalid JSON: {e}"}
+                continue
+            if not isinstance(record, dict):
+                yield {"line": line_number, "error": "expected a JSON object"}
+                continue
+            notes = record.get("notes", [])
+            if isinstance(notes, str):
+                notes = split_notes(notes)
+            style = record.get("style") or default_style
+            if not isinstance(notes, list) or not all(isinstance(n, str) for n in notes):
+                yield {"line": line_number, "error": "notes must be a string or a list of strings"}
+            elif style is not None and not isinstance(style, str):
+                yield {"line": line_number, "error": "style must be a string"}
+            elif not notes:
+                yield {"line": line_number, "error": NO_NOTES}
+            else:
+                yield notes, style
+        else:
+            notes = split_notes(line)
+            yield (notes, default_style) if notes else {"line": line_number, "error": NO_NOTES}
+
+def analyze_stream(note_sets):
+    """Lazily analyzes (notes, style) pairs, yielding one result dict each.
+
+    Error records from read_note_sets are passed through unchanged. An empty note set is an
+    error too: every scale contains it, so it would match all of them.
+    """
+    for item in note_sets:
+        if isinstance(item, dict):
+            yield item
+            continue
+        notes, style = item
+        if not notes:
+            yield {"notes": notes, "style": style, "error": NO_NOTES}
+            continue
+        if style is not None and style not in style_scales:
+            yield {"notes": notes, "style": style, "error": f"unknown style: {style}"}
+            continue
+        yield analyze_notes(notes, style)
+
+def encode_results(results):
+    """Serializes result dicts as compact JSON lines."""
+    for result in results:
+        yield json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+
+def analyze_chunk(note_sets):
+    """Worker entry point: analyzes and serializes one chunk, so only strings cross the process boundary."""
+    return list(encode_results(analyze_stream(note_sets)))
+
+def iter_chunks(iterable, size):
+    """Yields lists of up to size items from iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def install_profile(path):
+    """Worker initializer: loads the same style profile as the parent process."""
+    load_registry(path).install()
+
+def analyze_parallel(note_sets, workers=None, chunk_size=500, styles_path=None):
+    """Like encode_results(analyze_stream(...)) but sharded over a process pool.
+
+    Only a couple of chunks per worker are in flight at once, so input is still consumed
+    lazily; chunks are yielded back in submission order to keep the output stable.
+    """
+    workers = workers or os.cpu_count() or 1
+    initializer, initargs = (install_profile, (styles_path,)) if styles_path else (None, ())
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        pending = deque()
+        for chunk in iter_chunks(note_sets, chunk_size):
+            pending.append(pool.submit(analyze_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def write_lines(lines, out):
+    """Writes JSON lines to out; returns how many were written."""
+    count = 0
+    for line in lines:
+        out.write(line)
+        out.write("\n")
+        count += 1
+    return count
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m indienizer",
+        description="Find scales, chords and artist adaptations for note sets, one per line.",
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="JSONL, CSV or plain-text file of note sets (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="where to write JSONL results (default: stdout)")
+    parser.add_argument("-f", "--format", choices=INPUT_FORMATS, default="auto",
+                        help="input format; auto picks csv for .csv files and sniffs each line otherwise")
+    parser.add_argument("-s", "--style", help="artist style for lines that don't name one (default: all scales)")
+    parser.add_argument("--styles", metavar="PROFILE",
+                        help="JSON/TOML style profile to load on top of the built-in artists")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="analyze in this many processes (0 = one per CPU core; default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=500,
+                        help="note sets per work unit when --workers is used (default: 500)")
+    parser.add_argument("--profile", nargs="?", const="-", metavar="PATH",
+                        help="time the analysis steps; report on stderr at exit, or as JSON to PATH "
+                             "(same as INDIENIZER_PROFILE; covers this process only, so use with -j 1)")
+    parser.add_argument("--cprofile", metavar="PATH", help="write a cProfile dump of the whole run to PATH")
+    return parser
+
+def run(args, lines, out):
+    """Streams lines through the analysis according to parsed args."""
+    fmt = args.format
+    if fmt == "auto" and args.input.lower().endswith(".csv"):
+        fmt = "csv"
+    note_sets = read_note_sets(lines, fmt, args.style)
+    if args.workers == 1:
+        return write_lines(encode_results(analyze_stream(note_sets)), out)
+    return write_lines(analyze_parallel(note_sets, args.workers or None, args.chunk_size, args.styles), out)
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 0:
+        parser.error("--workers must be 0 (one per CPU core) or more")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    # Only the entry points read INDIENIZER_PROFILE, so library users and pool workers stay unprofiled
+    if args.profile:
+        profiling.enable(args.profile)
+    else:
+        profiling.enable_from_env()
+    if args.styles:
+        try:
+            load_registry(args.styles).install()
+        except (OSError, ValueError) as e:
+            parser.error(f"--styles: {e}")
+    if args.style is not None and args.style not in style_scales:
+        parser.error(f"unknown style: {args.style} (choose from {', '.join(style_scales)})")
+
+    try:
+        infile = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    except OSError as e:
+        parser.error(f"can't read {args.input}: {e.strerror or e}")
+    try:
+        outfile = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    except OSError as e:
+        if infile is not sys.stdin:
+            infile.close()
+        parser.error(f"can't write {args.output}: {e.strerror or e}")
+    profiler = cProfile.Profile() if args.cprofile else None
+    try:
+        if profiler is not None:
+            profiler.runcall(run, args, infile, outfile)
+        else:
+            run(args, infile, outfile)
+    except BrokenPipeError:
+        # e.g. piped into `head`; stop quietly like other CLI tools
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    finally:
+        if profiler is not None:
+            profiler.dump_stats(args.cprofile)
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+    return 0
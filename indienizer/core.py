@@ -0,0 +1,317 @@
+"""Headless analysis core for INDIENIZER: scale/chord tables and lookups.
+
+Nothing in here imports tkinter, so it can be used from workers, servers and scripts.
+"""
+
+from functools import lru_cache
+
+notes_list = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
+note_to_index_map = {note: index for index, note in enumerate(notes_list)}
+
+# Scale patterns defined by intervals (semitones)
+scale_patterns = {
+    "major":            [2, 2, 1, 2, 2, 2, 1],
+    "natural_minor":    [2, 1, 2, 2, 1, 2, 2],
+    "harmonic_minor":   [2, 1, 2, 2, 1, 3, 1],
+    "melodic_minor_asc":[2, 1, 2, 2, 2, 2, 1],
+    "melodic_minor_desc":[2, 1, 2, 2, 1, 2, 2], # Descending melodic minor = natural minor
+    "major_pentatonic": [2, 2, 3, 2, 3],
+    "minor_pentatonic": [3, 2, 2, 3, 2],
+    "blues":            [3, 2, 1, 1, 3, 2],
+    "whole_tone":       [2, 2, 2, 2, 2, 2],
+    "octatonic":        [2, 1, 2, 1, 2, 1, 2, 1],
+    "ionian":           [2, 2, 1, 2, 2, 2, 1],
+    "dorian":           [2, 1, 2, 2, 2, 1, 2],
+    "phrygian":         [1, 2, 2, 2, 1, 2, 2],
+    "lydian":           [2, 2, 2, 1, 2, 2, 1],
+    "mixolydian":       [2, 2, 1, 2, 2, 1, 2],
+    "aeolian":          [2, 1, 2, 2, 1, 2, 2],
+    "locrian":          [1, 2, 2, 1, 2, 2, 2],
+}
+
+# --- MODIFIED --- Chord types now distinguish 'dom' (dominant 7th) chords
+# This is crucial for assigning correct extensions like '7', '9', '7alt'
+chord_types_map = {
+    "major":            ['maj', 'min', 'min', 'maj', 'dom', 'min', 'dim'],
+    "ionian":           ['maj', 'min', 'min', 'maj', 'dom', 'min', 'dim'],
+    "natural_minor":    ['min', 'dim', 'maj', 'min', 'min', 'maj', 'maj'],
+    "aeolian":          ['min', 'dim', 'maj', 'min', 'min', 'maj', 'maj'],
+    "harmonic_minor":   ['min', 'dim', 'aug', 'min', 'dom', 'maj', 'dim'],
+    "melodic_minor_asc":['min', 'min', 'aug', 'dom', 'dom', 'dim', 'dim'],
+    "melodic_minor_desc":['min', 'dim', 'maj', 'min', 'min', 'maj', 'maj'],
+    "dorian":           ['min', 'min', 'maj', 'dom', 'min', 'dim', 'maj'],
+    "phrygian":         ['min', 'maj', 'dom', 'min', 'dim', 'maj', 'min'],
+    "lydian":           ['maj', 'dom', 'min', 'dim', 'maj', 'min', 'min'],
+    "mixolydian":       ['dom', 'min', 'dim', 'maj', 'min', 'min', 'maj'],
+    "locrian":          ['dim', 'maj', 'min', 'min', 'maj', 'dom', 'min'],
+}
+
+# --- UPDATED --- Extension compatibility with proper major/minor distinction
+extension_compatibility = {
+    'maj': ['maj7', 'maj9', '6', 'add9', 'sus2', 'sus4', 'add11', '#11', '13'],
+    'min': ['m7', 'm9', 'm11', 'm6', 'madd9', 'sus2', 'sus4', 'madd11'],
+    'dom': ['7', '9', '11', '13', '7sus4', '7b9', '7#9', '7#11', '7b13', '7alt', 'sus4'],
+    'dim': ['dim7', 'm7b5'],
+    'aug': ['maj7#5', '+7']
+}
+
+# Scales associated with each artist style
+style_scales = {
+    "EMPTY": [],
+    "Phoebe Bridgers": ["aeolian", "dorian", "mixolydian"],
+    "Angus & Julia Stone": ["aeolian", "dorian", "major_pentatonic"],
+    "Low Roar": ["aeolian", "dorian", "minor_pentatonic"],
+    "Novo Amor": ["aeolian", "dorian", "major_pentatonic"],
+    "SYML": ["aeolian", "harmonic_minor", "dorian"],
+    "Iron & Wine": ["aeolian", "mixolydian", "major_pentatonic"],
+    "Bon Iver": ["dorian", "aeolian", "lydian", "mixolydian"], # Added more for variety
+    "Leif Vollebekk": ["dorian", "mixolydian", "minor_pentatonic"],
+    "Lana Del Rey": ["harmonic_minor", "aeolian", "dorian"],
+    "Alexandra Savior": ["aeolian", "harmonic_minor", "phrygian"],
+    "London Grammar": ["dorian", "aeolian", "harmonic_minor"],
+    "Billie Eilish": ["phrygian", "harmonic_minor", "blues"],
+}
+
+# --- UPDATED --- Artist extensions with proper major/minor notation
+artist_extensions_data = {
+    "EMPTY": [],
+    "Phoebe Bridgers": ["maj7", "m7", "sus2", "sus4", "add9", "madd9"],
+    "Angus & Julia Stone": ["maj7", "m7", "sus2", "sus4", "add9", "madd9", "add11", "madd11"],
+    "Low Roar": ["maj7", "m7", "sus2", "sus4", "add9", "madd9"],
+    "Novo Amor": ["maj7", "m7", "sus2", "sus4", "add9", "madd9"],
+    "SYML": ["maj7", "m7", "sus2", "sus4", "add9", "madd9"],
+    "Iron & Wine": ["maj7", "m7", "sus2", "sus4", "add9", "madd9"],
+    "Bon Iver": ["maj7", "m7", "maj9", "m9", "sus2", "sus4", "add9", "madd9", "m7b5", "7#11", "7b13", "7alt", "7"],
+    "Leif Vollebekk": ["maj7", "m7", "sus2", "sus4", "add9", "madd9", "7"],
+    "Lana Del Rey": ["maj7", "m7", "dim7", "sus4", "add9", "madd9", "6", "m6", "7"],
+    "Alexandra Savior": ["maj7", "m7", "sus2", "sus4", "add9", "madd9", "dim7"],
+    "London Grammar": ["maj7", "m7", "m9", "sus2", "sus4", "add9", "madd9", "add11", "madd11"],
+    "Billie Eilish": ["m7", "maj7", "dim7", "m7b5", "sus2", "add9", "madd9", "7"]
+}
+
+# Borrowed chords are described per key type (major/minor)
+artist_borrowed_chords_data = {
+    "Phoebe Bridgers": {
+        "major_key": ["Light to moderate use, typically used as 'color chords'", "Common: minor iv (e.g., Fm in C Major)"],
+        "minor_key": []
+    },
+    "Angus & Julia Stone": { "major_key": ["Occasional use, mainly for color"], "minor_key": [] },
+    "Low Roar": { "major_key": ["Occasional use, mainly for color"], "minor_key": [] },
+    "Novo Amor": { "major_key": ["Occasional use, mainly for color"], "minor_key": [] },
+    "SYML": { "major_key": ["Occasional use, mainly for color"], "minor_key": [] },
+    "Iron & Wine": { "major_key": ["Occasional use, mainly for color"], "minor_key": [] },
+    "Bon Iver": {
+        "major_key": ["Heavy use of modal interchange", "Frequently borrows from parallel minor/major", "Known for chromatic harmony and unconventional chord progressions"],
+        "minor_key": ["Heavy use of modal interchange", "Frequently borrows from parallel minor/major", "Known for chromatic harmony and unconventional chord progressions"]
+    },
+    "Leif Vollebekk": { "major_key": ["Minimal use, prefers diatonic harmony"], "minor_key": ["Minimal use, prefers diatonic harmony"] },
+    "Lana Del Rey": {
+        "major_key": ["Moderate to heavy use", "Often borrows from minor mode (e.g., minor iv, bVII)"],
+        "minor_key": ["Moderate to heavy use", "Often borrows from major mode (e.g., Major IV)"]
+    },
+    "Alexandra Savior": {
+        "major_key": ["Moderate use, similar to Lana Del Rey's style"],
+        "minor_key": ["Moderate use, similar to Lana Del Rey's style"]
+    },
+    "London Grammar": { "major_key": ["Some use for atmospheric effects"], "minor_key": ["Some use for atmospheric effects"] },
+    "Billie Eilish": {
+        "major_key": ["Moderate use for dark, moody effects", "Often employs chromatic harmony and modal interchange"],
+        "minor_key": ["Moderate use for dark, moody effects", "Often employs chromatic harmony and modal interchange"]
+    },
+    "EMPTY": {"major_key": [], "minor_key": []}
+}
+
+# How freely each artist borrows from the parallel key, from 0 (never) to 1 (constantly); read by
+# indienizer.progressions to price borrowed chords. The notes above say which keys they borrow in.
+artist_borrow_weights = {
+    "Phoebe Bridgers": 0.6,
+    "Angus & Julia Stone": 0.4,
+    "Low Roar": 0.4,
+    "Novo Amor": 0.4,
+    "SYML": 0.4,
+    "Iron & Wine": 0.4,
+    "Bon Iver": 1.0,
+    "Leif Vollebekk": 0.1,
+    "Lana Del Rey": 0.9,
+    "Alexandra Savior": 0.75,
+    "London Grammar": 0.5,
+    "Billie Eilish": 0.75,
+    "EMPTY": 0.0,
+}
+
+def scale_generator(root_note_name, scale_type):
+    """Generates notes for a given scale type starting from a root note."""
+    pattern = scale_patterns.get(scale_type)
+    if not pattern:
+        return []
+
+    root_index = note_to_index_map[root_note_name]
+    scale_notes = [root_note_name]
+    current_index = root_index
+
+    for interval in pattern:
+        current_index = (current_index + interval) % len(notes_list)
+        scale_notes.append(notes_list[current_index])
+
+    if scale_type in chord_types_map and len(scale_notes) > 7:
+        scale_notes = scale_notes[:-1]
+    return scale_notes
+
+def chords_in_scale(scale_notes, scale_type):
+    """Determines the basic triad/seventh chords within a given scale."""
+    chord_types = chord_types_map.get(scale_type)
+    if not chord_types or len(scale_notes) < len(chord_types):
+        return ["Basic chords not defined for this scale type or scale too short."]
+
+    chords = []
+    for i in range(len(chord_types)):
+        note = scale_notes[i % len(scale_notes)]
+        chords.append((note, chord_types[i]))
+    return chords
+
+def notes_to_mask(notes):
+    """Packs note names into a 12-bit pitch-class mask (bit i = notes_list[i]).
+
+    Returns None if any note is not in notes_list, since no scale can contain it.
+    """
+    mask = 0
+    for n in notes:
+        index = note_to_index_map.get(n.upper())
+        if index is None:
+            return None
+        mask |= 1 << index
+    return mask
+
+def build_scale_index():
+    """Precomputes every (root, scale_type) as a pitch-class mask, plus an inverted note index.
+
+    Entries keep the root-major, scale_patterns order that find_possible_scales reports in.
+    """
+    entries = []
+    for root in notes_list:
+        for scale_type in scale_patterns:
+            scale_notes = scale_generator(root, scale_type)
+            entries.append((root, scale_type, scale_notes, notes_to_mask(scale_notes)))
+
+    # note index -> ids of the entries whose scale contains that note, in entry order
+    postings = [[] for _ in notes_list]
+    for entry_id, (_, _, _, mask) in enumerate(entries):
+        for index in range(len(notes_list)):
+            if mask & (1 << index):
+                postings[index].append(entry_id)
+    return entries, postings
+
+# Built once at import; find_possible_scales only does bitmask tests against it
+scale_index, note_postings = build_scale_index()
+# Bumped whenever the tables are replaced, so modules with derived tables can tell they're stale
+scale_index_version = 0
+
+def rebuild_scale_index():
+    """Rebuilds scale_index/note_postings in place after the scale tables changed, and drops caches."""
+    global scale_index_version
+    entries, postings = build_scale_index()
+    scale_index[:] = entries
+    note_postings[:] = postings
+    scale_index_version += 1
+    invalidate_adaptation_cache()
+
+def find_possible_scales(song_notes, allowed_scales=None):
+    """Finds scales that contain all the given song notes, optionally filtered by artist style."""
+    song_mask = notes_to_mask(song_notes)
+    if song_mask is None:
+        return []
+
+    # Start from the shortest posting list of the song's notes; no notes means every scale
+    candidates = range(len(scale_index))
+    for index in range(len(notes_list)):
+        if song_mask & (1 << index) and len(note_postings[index]) < len(candidates):
+            candidates = note_postings[index]
+
+    results = []
+    for entry_id in candidates:
+        root, scale_type, scale_notes, scale_mask = scale_index[entry_id]
+        if allowed_scales and scale_type not in allowed_scales:
+            continue
+        if scale_mask & song_mask == song_mask:
+            results.append((root, scale_type, list(scale_notes)))
+    return results
+
+@lru_cache(maxsize=64)
+def style_extensions(style):
+    """Maps each chord quality to the artist's extensions that suit it, in the artist's order."""
+    artist_extensions = artist_extensions_data.get(style, [])
+    return {
+        quality: tuple(ext for ext in artist_extensions if ext in compatible_suffixes)
+        for quality, compatible_suffixes in extension_compatibility.items()
+    }
+
+def chord_extensions(chords, style):
+    """Lists the artist's extensions that suit each chord's quality.
+
+    Returns (chord_root, chord_quality, (extension, ...)) for every chord with at least one match.
+    """
+    by_quality = style_extensions(style)
+    extensions = []
+    for chord in chords:
+        if not isinstance(chord, tuple):
+            continue  # chords_in_scale's "not defined" message
+        chord_root, chord_quality = chord
+        valid_extensions = by_quality.get(chord_quality)
+        if valid_extensions:
+            extensions.append((chord_root, chord_quality, valid_extensions))
+    return extensions
+
+def borrowed_chords(scale_type, style):
+    """Returns ("major" | "minor", descriptions) of the artist's borrowed-chord usage, or None."""
+    borrowed_chords_info = artist_borrowed_chords_data.get(style, {"major_key": [], "minor_key": []})
+    is_major_like = "major" in scale_type or scale_type in ["ionian", "lydian", "mixolydian"]
+    is_minor_like = "minor" in scale_type or scale_type in ["aeolian", "dorian", "phrygian", "locrian"]
+
+    if is_major_like and borrowed_chords_info.get("major_key"):
+        return "major", tuple(borrowed_chords_info["major_key"])
+    elif is_minor_like and borrowed_chords_info.get("minor_key"):
+        return "minor", tuple(borrowed_chords_info["minor_key"])
+    return None
+
+# Every (root, scale_type, style) has a fixed answer: 12 roots x 17 scales x 13 styles fits comfortably
+@lru_cache(maxsize=4096)
+def adaptation_table(root, scale_type, style):
+    """Returns the cached (chords, extensions, borrowed) for one scale under an artist style.
+
+    chords is chords_in_scale's output as a tuple; extensions and borrowed are as returned by
+    chord_extensions and borrowed_chords. Everything is immutable, since it is shared between callers.
+    """
+    chords = tuple(chords_in_scale(scale_generator(root, scale_type), scale_type))
+    return chords, tuple(chord_extensions(chords, style)), borrowed_chords(scale_type, style)
+
+def adaptation_cache_info():
+    """Hit/miss counters of the adaptation cache, as {"hits", "misses", "size", "maxsize"}."""
+    info = adaptation_table.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
+
+def invalidate_adaptation_cache():
+    """Drops cached chord/extension tables; call after editing the style or extension tables."""
+    adaptation_table.cache_clear()
+    style_extensions.cache_clear()
+
+def analyze_notes(notes, style=None):
+    """Runs the full scale -> chords -> artist adaptation analysis for one note set.
+
+    Returns a JSON-ready dict; without a style every scale type is considered.
+    """
+    notes = [n.upper() for n in notes]
+    results = []
+    for root, scale_type, scale_notes in find_possible_scales(notes, style_scales.get(style)):
+        chords, extensions, borrowed = adaptation_table(root, scale_type, style)
+        results.append({
+            "root": root,
+            "scale_type": scale_type,
+            "notes": scale_notes,
+            "chords": [list(chord) for chord in chords if isinstance(chord, tuple)],
+            "extensions": [
+                {"root": chord_root, "quality": chord_quality, "chords": [chord_root + ext for ext in exts]}
+                for chord_root, chord_quality, exts in extensions
+            ],
+            "borrowed": {"context": borrowed[0], "usage": list(borrowed[1])} if borrowed else None,
+        })
+    return {"notes": notes, "style": style, "scales": results}
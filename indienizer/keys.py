@@ -0,0 +1,127 @@
+"""Sliding-window key-change detection over long note-event streams.
+
+Instead of re-running find_possible_scales for every window, the window keeps running counts:
+per pitch class, and per candidate scale the number of window notes it contains. When a note
+enters or leaves the window only the scales containing that pitch class are touched (via the
+core note_postings index), so each event costs the same however large the window is.
+
+The best key for a window is the scale containing the most of its notes; ties go to the scale
+whose root is played most, then to the one listed first in allowed_scales, then to the smaller
+scale. The current key is kept until another scale contains more of the window's notes, which
+stops regions flickering between equally good candidates (relative major/minor, modes).
+"""
+
+from collections import deque
+
+from indienizer.core import chords_in_scale, note_postings, note_to_index_map, notes_list, scale_index
+
+# Scale types with a chord table, minus aliases (ionian = major, aeolian = natural_minor)
+DEFAULT_KEY_SCALES = (
+    "major", "natural_minor", "harmonic_minor", "melodic_minor_asc",
+    "dorian", "phrygian", "lydian", "mixolydian", "locrian",
+)
+
+def pitch_class(note):
+    """Pitch class of a note name ("F#") or a MIDI note number / pitch class (66 or 6)."""
+    if isinstance(note, int):
+        return note % len(notes_list)
+    return note_to_index_map[note.upper()]
+
+def iter_key_changes(events, window=32, allowed_scales=DEFAULT_KEY_SCALES, hop=1):
+    """Yields (time, root, scale_type, scale_notes) each time the best key for the window changes.
+
+    events is an iterable of (time, note) in time order. The key is first judged once the window
+    is full (or at the end of a shorter stream), then every hop events. window and hop must be
+    at least 1 (ValueError otherwise).
+    """
+    if window < 1 or hop < 1:
+        raise ValueError("window and hop must be at least 1")
+    rows = [row for row, (_, scale_type, _, _) in enumerate(scale_index)
+            if not allowed_scales or scale_type in allowed_scales]
+    local = {row: i for i, row in enumerate(rows)}
+    # pitch class -> candidate positions whose scale contains it
+    postings = [[local[row] for row in note_postings[pc] if row in local] for pc in range(len(notes_list))]
+    root_pcs = [note_to_index_map[scale_index[row][0]] for row in rows]
+    # Tie-breaks below "notes contained": the root played most, then earlier allowed_scales entries
+    # (plain major/minor before modes), then the smaller scale. Packed into one int per candidate.
+    order = list(allowed_scales) if isinstance(allowed_scales, (list, tuple)) else []
+    preference = [
+        (len(order) - order.index(scale_index[row][1]) if scale_index[row][1] in order else 0)
+        * (len(notes_list) + 1) + len(notes_list) - bin(scale_index[row][3]).count("1")
+        for row in rows
+    ]
+    count_weight = (len(order) + 1) * (len(notes_list) + 1)
+    inside_weight = (window + 1) * count_weight
+
+    inside = [0] * len(rows)
+    counts = [0] * len(notes_list)
+    recent = deque()
+    current = None
+    since_check = 0
+    time = None
+
+    def best():
+        scores = [n * inside_weight + counts[r] * count_weight + p for n, r, p in zip(inside, root_pcs, preference)]
+        top = scores.index(max(scores))
+        if current is not None and inside[current] == inside[top]:
+            return current
+        return top
+
+    for time, note in events:
+        pc = pitch_class(note)
+        recent.append(pc)
+        counts[pc] += 1
+        for i in postings[pc]:
+            inside[i] += 1
+        if len(recent) > window:
+            old = recent.popleft()
+            counts[old] -= 1
+            for i in postings[old]:
+                inside[i] -= 1
+            since_check += 1
+        elif len(recent) == window:
+            since_check = hop  # window just filled up: judge it right away
+        if since_check >= hop and rows:
+            since_check = 0
+            key = best()
+            if key != current:
+                current = key
+                root, scale_type, scale_notes, _ = scale_index[rows[key]]
+                yield time, root, scale_type, list(scale_notes)
+
+    if current is None and recent and rows:
+        root, scale_type, scale_notes, _ = scale_index[rows[best()]]
+        yield time, root, scale_type, list(scale_notes)
+
+def key_regions(events, window=32, allowed_scales=DEFAULT_KEY_SCALES, hop=1):
+    """Splits a note-event stream into key regions with their chords.
+
+    Returns [{"start", "end", "root", "scale_type", "notes", "chords"}], where start is the time of
+    the event at which the key was detected (the first region starts at the first event) and end
+    is the start of the next region, or the last event's time.
+    """
+    first_time = last_time = None
+
+    def timed(events):
+        nonlocal first_time, last_time
+        for time, note in events:
+            if first_time is None:
+                first_time = time
+            last_time = time
+            yield time, note
+
+    regions = []
+    for time, root, scale_type, scale_notes in iter_key_changes(timed(events), window, allowed_scales, hop):
+        if regions:
+            regions[-1]["end"] = time
+        regions.append({
+            "start": first_time if not regions else time,
+            "end": None,
+            "root": root,
+            "scale_type": scale_type,
+            "notes": scale_notes,
+            "chords": [list(chord) for chord in chords_in_scale(scale_notes, scale_type) if isinstance(chord, tuple)],
+        })
+    if regions:
+        regions[-1]["end"] = last_time
+    return regions
@@ -0,0 +1,215 @@
+"""Streaming Standard MIDI File reader that turns songs into note sets for find_possible_scales.
+
+Files are memory-mapped and parsed in place, one event at a time: only the pitch classes per
+window (a 12-bit mask each) are kept, never the tracks themselves, so large archives are
+processed with bounded memory. Drums (channel 10) are skipped since they carry no pitch.
+
+    python -m indienizer.midi songs/ --style "Bon Iver" --bars 2 > keys.jsonl
+"""
+
+import argparse
+import heapq
+import json
+import mmap
+import os
+import sys
+
+from indienizer.core import find_possible_scales, notes_list, style_scales
+from indienizer.keys import key_regions
+
+MIDI_EXTENSIONS = (".mid", ".midi", ".smf")
+DRUM_CHANNEL = 9  # channel 10, zero-based
+
+def read_varlen(data, pos):
+    """Reads a MIDI variable-length quantity; returns (value, next position)."""
+    value = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, pos
+
+def read_header(data):
+    """Parses the MThd chunk; returns (format, track count, ticks per quarter note, first chunk position)."""
+    if data[:4] != b"MThd" or len(data) < 14:
+        raise ValueError("not a Standard MIDI File")
+    length = int.from_bytes(data[4:8], "big")
+    smf_format = int.from_bytes(data[8:10], "big")
+    tracks = int.from_bytes(data[10:12], "big")
+    division = int.from_bytes(data[12:14], "big")
+    if division & 0x8000:
+        raise ValueError("SMPTE time division is not supported")
+    return smf_format, tracks, division, 8 + length
+
+def iter_track_events(data, pos, end):
+    """Yields (tick, "note", pitch class) and (tick, "time_signature", (numerator, denominator)) for one track."""
+    tick = 0
+    running_status = None
+    while pos < end:
+        delta, pos = read_varlen(data, pos)
+        tick += delta
+        status = data[pos]
+        if status & 0x80:
+            pos += 1
+        elif running_status is None:
+            raise ValueError("data byte without a running status")
+        else:
+            status = running_status
+
+        if status == 0xFF:
+            meta_type = data[pos]
+            length, pos = read_varlen(data, pos + 1)
+            if meta_type == 0x2F:  # end of track
+                return
+            if meta_type == 0x58 and length >= 2:
+                yield tick, "time_signature", (data[pos], 2 ** data[pos + 1])
+            pos += length
+        elif status in (0xF0, 0xF7):
+            running_status = None
+            length, pos = read_varlen(data, pos)
+            pos += length
+        else:
+            running_status = status
+            kind = status & 0xF0
+            if kind in (0xC0, 0xD0):
+                pos += 1
+                continue
+            if kind == 0x90 and data[pos + 1] > 0 and status & 0x0F != DRUM_CHANNEL:
+                yield tick, "note", data[pos] % len(notes_list)
+            pos += 2
+
+def track_spans(data):
+    """Yields (start, end) byte positions of every MTrk chunk's events."""
+    _, _, _, pos = read_header(data)
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        end = pos + 8 + int.from_bytes(data[pos + 4:pos + 8], "big")
+        if chunk_id == b"MTrk":
+            yield pos + 8, min(end, len(data))
+        pos = end
+
+def iter_midi_events(data):
+    """Yields the events of every track in file order (track by track, not merged by time)."""
+    for start, end in track_spans(data):
+        yield from iter_track_events(data, start, end)
+
+def iter_note_events(data):
+    """Yields (tick, pitch class) for every note-on, merged across tracks in time order.
+
+    Each track is its own lazy reader over the mapped file, so merging costs one pending event per track.
+    """
+    tracks = [iter_track_events(data, start, end) for start, end in track_spans(data)]
+    for tick, kind, value in heapq.merge(*tracks, key=lambda event: event[0]):
+        if kind == "note":
+            yield tick, value
+
+def window_masks(data, bars_per_window=1):
+    """Folds a file's notes into pitch-class masks: (whole song mask, {window index: mask}).
+
+    Bars follow the file's time signatures (4/4 until one is given). In multi-track files the
+    time signatures live in the first track, so they are known before the notes are read.
+    """
+    if bars_per_window < 1:
+        raise ValueError("bars_per_window must be at least 1")
+    _, _, division, _ = read_header(data)
+    # (start tick, ticks per bar, bar number at start tick), one per time signature
+    meters = [(0, division * 4, 0)]
+    song_mask = 0
+    windows = {}
+    for tick, kind, value in iter_midi_events(data):
+        if kind == "time_signature":
+            start, ticks_per_bar, first_bar = meters[-1]
+            if tick >= start:
+                numerator, denominator = value
+                # Meter changes normally sit on a bar line; round up if one doesn't
+                bar = first_bar + -(-(tick - start) // ticks_per_bar)
+                meters.append((tick, max(1, division * 4 * numerator // denominator), bar))
+            continue
+        for start, ticks_per_bar, first_bar in reversed(meters):
+            if tick >= start:
+                break
+        window = (first_bar + (tick - start) // ticks_per_bar) // bars_per_window
+        song_mask |= 1 << value
+        windows[window] = windows.get(window, 0) | 1 << value
+    return song_mask, windows
+
+def mask_notes(mask):
+    """Note names of a pitch-class mask, in notes_list order."""
+    return [note for index, note in enumerate(notes_list) if mask >> index & 1]
+
+def scale_names(notes, allowed_scales):
+    """find_possible_scales results as compact [root, scale_type] pairs.
+
+    No notes (a drum-only file or window) match nothing, not every scale.
+    """
+    if not notes:
+        return []
+    return [[root, scale_type] for root, scale_type, _ in find_possible_scales(notes, allowed_scales)]
+
+def analyze_midi_file(path, bars_per_window=1, allowed_scales=None, key_window=None):
+    """Matching scales for a whole MIDI file and for each window of bars_per_window bars.
+
+    With key_window (a number of notes), also reports key regions (see indienizer.keys), timed in ticks.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError("empty file")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            song_mask, windows = window_masks(data, bars_per_window)
+            keys = key_regions(iter_note_events(data), key_window) if key_window else None
+
+    song_notes = mask_notes(song_mask)
+    result = {"file": path, "notes": song_notes, "scales": scale_names(song_notes, allowed_scales), "windows": []}
+    for window in sorted(windows):
+        notes = mask_notes(windows[window])
+        result["windows"].append({
+            "bar": window * bars_per_window + 1,
+            "notes": notes,
+            "scales": scale_names(notes, allowed_scales),
+        })
+    if keys is not None:
+        result["keys"] = keys
+    return result
+
+def iter_midi_paths(path):
+    """Yields MIDI files under a directory (recursively, sorted), or the path itself if it's a file."""
+    if not os.path.isdir(path):
+        yield path
+        return
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith(MIDI_EXTENSIONS):
+                yield os.path.join(dirpath, name)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m indienizer.midi",
+        description="Find scales per song and per window of bars for MIDI files, as JSONL.",
+    )
+    parser.add_argument("paths", nargs="+", help="MIDI files or directories of them")
+    parser.add_argument("-s", "--style", choices=list(style_scales.keys()),
+                        help="only consider this artist's scales (default: all scales)")
+    parser.add_argument("-b", "--bars", type=int, default=1, help="bars per window (default: 1)")
+    parser.add_argument("-k", "--keys", type=int, metavar="NOTES",
+                        help="also detect key changes over a sliding window of this many notes")
+    args = parser.parse_args(argv)
+    if args.bars < 1:
+        parser.error("--bars must be at least 1")
+    if args.keys is not None and args.keys < 1:
+        parser.error("--keys must be at least 1")
+
+    allowed_scales = style_scales.get(args.style)
+    for path in args.paths:
+        for midi_path in iter_midi_paths(path):
+            try:
+                result = analyze_midi_file(midi_path, args.bars, allowed_scales, args.keys)
+            except (OSError, ValueError, IndexError) as e:
+                # IndexError: a truncated file ran out of bytes mid-event
+                result = {"file": midi_path, "error": str(e) or type(e).__name__}
+            sys.stdout.write(json.dumps(result, separators=(",", ":")) + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Opt-in timing instrumentation for the analysis and the GUI's rendering.
+
+Off by default, and free when off: nothing is wrapped until enable() runs. Turn it on with
+    INDIENIZER_PROFILE=1            timings summary on stderr at exit
+    INDIENIZER_PROFILE=stats.json   timings written there as JSON at exit
+or with --profile on `python -m indienizer` and INDIENIZER2.0.py. Only those two entry points
+read the variable (via enable_from_env), so importing indienizer never turns profiling on,
+and neither do the CLI's --workers processes. The CLI also takes --cprofile PATH for a full
+cProfile dump (open it with `python -m pstats PATH`).
+
+enable() wraps find_possible_scales, scale_generator, chords_in_scale, adaptation_table and
+analyze_notes wherever they have been imported, so each call adds to a per-name count and
+total/max time. Callers time their own phases with `with phase(name):`; the GUI uses this for
+the adaptation loop and each widget-insert phase, which is what tells a slow analysis apart
+from slow Tk rendering. Timings cover this process only; with the CLI's --workers, use -j 1.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from indienizer import core
+
+ENV_VAR = "INDIENIZER_PROFILE"
+INSTRUMENTED = ("find_possible_scales", "scale_generator", "chords_in_scale", "adaptation_table", "analyze_notes")
+
+enabled = False
+stats = {}  # name -> [calls, total seconds, max seconds]
+lock = threading.Lock()  # the GUI records from its worker thread and the Tk main loop
+
+def record(name, seconds):
+    with lock:
+        entry = stats.get(name)
+        if entry is None:
+            stats[name] = [1, seconds, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
+
+@contextmanager
+def phase(name):
+    """Times the with-block under name (when profiling is enabled)."""
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+def timed(name, fn):
+    """fn wrapped to record each call under name."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            record(name, time.perf_counter() - start)
+    # Keep lru_cache's cache_info/cache_clear reachable through the wrapper
+    for attr in ("cache_info", "cache_clear"):
+        if hasattr(fn, attr):
+            setattr(wrapper, attr, getattr(fn, attr))
+    return wrapper
+
+def enable(report_to=None):
+    """Starts recording; report_to ("-" for stderr, or a JSON path) gets the report at exit.
+
+    Every loaded module that imported one of the INSTRUMENTED functions (including the GUI
+    script and core itself, for its internal calls) gets the timed version.
+    """
+    global enabled
+    if enabled:
+        return
+    enabled = True
+    for name in INSTRUMENTED:
+        original = getattr(core, name)
+        wrapper = timed(name, original)
+        for module in list(sys.modules.values()):
+            namespace = getattr(module, "__dict__", None)
+            if namespace is not None and namespace.get(name) is original:
+                namespace[name] = wrapper
+    if report_to:
+        atexit.register(write_report, report_to)
+
+def snapshot():
+    """Current {name: (calls, total seconds)}, for since()."""
+    with lock:
+        return {name: (entry[0], entry[1]) for name, entry in stats.items()}
+
+def since(before):
+    """{name: (calls, seconds)} recorded after the snapshot before was taken."""
+    changes = {}
+    for name, (calls, total) in snapshot().items():
+        old_calls, old_total = before.get(name, (0, 0.0))
+        if calls != old_calls:
+            changes[name] = (calls - old_calls, total - old_total)
+    return changes
+
+def reset():
+    with lock:
+        stats.clear()
+
+def report():
+    """The recorded timings as {name: {"calls", "total_ms", "mean_us", "max_us"}}, slowest total first."""
+    with lock:
+        entries = sorted(stats.items(), key=lambda item: -item[1][1])
+        return {
+            name: {
+                "calls": calls,
+                "total_ms": round(total * 1e3, 3),
+                "mean_us": round(total / calls * 1e6, 2),
+                "max_us": round(longest * 1e6, 2),
+            }
+            for name, (calls, total, longest) in entries
+        }
+
+def write_report(path="-"):
+    """Writes report() as a table to stderr ("-") or as JSON to path."""
+    timings = report()
+    if path != "-":
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"timings": timings}, f, indent=1)
+            f.write("\n")
+        return
+    print(f"{'':24}{'calls':>10}{'total ms':>12}{'mean us':>12}{'max us':>12}", file=sys.stderr)
+    for name, t in timings.items():
+        print(f"{name:24}{t['calls']:>10}{t['total_ms']:>12.3f}{t['mean_us']:>12.2f}{t['max_us']:>12.2f}", file=sys.stderr)
+
+def enable_from_env():
+    """Enables profiling if INDIENIZER_PROFILE is set (to "1" for stderr, or a JSON path)."""
+    value = os.environ.get(ENV_VAR, "")
+    if value and value != "0":
+        enable("-" if value == "1" else value)
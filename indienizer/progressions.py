@@ -0,0 +1,238 @@
+"""Chord progression suggestions for a key and artist style.
+
+The chord vocabulary is the key's diatonic chords (chords_in_scale), each as a plain triad and
+with every extension the artist uses for its quality, plus, for artists that borrow chords, the
+chords of the parallel major/minor key that aren't already diatonic.
+
+A progression's cost (lower is better) adds up, per step:
+  - voice-leading distance: semitones the voices move between the two chords
+  - a style cost for the new chord: the artist's own extensions are free, plain triads cost a
+    little and borrowed chords cost less the higher the artist's borrow weight
+  - penalties for staying on the same chord root and for going straight back to the chord
+    before the previous one (so progressions don't just rock between two chords)
+plus a penalty for not ending on the tonic. Progressions start on the tonic.
+
+The search space grows as (chords ** length), so it is never enumerated. A beam search keeps
+the best `beam` partial progressions per step in a bounded heap, and branch-and-bound prunes
+inside each step: states are expanded cheapest first, each over its successors sorted by
+transition cost, so both loops stop as soon as they can't beat the worst progression kept.
+Voice-leading distances are memoized and expanded into a transition table once per key.
+iter_progressions yields the final top-k lazily, best first.
+
+    python -m indienizer.progressions A aeolian --style "Bon Iver" --length 8 --top 5
+"""
+
+import argparse
+import heapq
+import sys
+from functools import lru_cache
+
+from indienizer.core import (
+    adaptation_table,
+    artist_borrow_weights,
+    artist_borrowed_chords_data,
+    chords_in_scale,
+    note_to_index_map,
+    notes_list,
+    scale_generator,
+    style_scales,
+)
+
+# Semitones above the chord root of each quality's plain triad; a dom chord's 7th comes from
+# its extensions ('7', '9', ...), so the triad is voiced and named like a major one
+QUALITY_INTERVALS = {
+    'maj': (0, 4, 7),
+    'min': (0, 3, 7),
+    'dom': (0, 4, 7),
+    'dim': (0, 3, 6),
+    'aug': (0, 4, 8),
+}
+
+# Semitones above the root for each (quality, extension) in extension_compatibility
+EXTENSION_INTERVALS = {
+    ('maj', 'maj7'): (0, 4, 7, 11), ('maj', 'maj9'): (0, 4, 7, 11, 2), ('maj', '6'): (0, 4, 7, 9),
+    ('maj', 'add9'): (0, 4, 7, 2), ('maj', 'sus2'): (0, 2, 7), ('maj', 'sus4'): (0, 5, 7),
+    ('maj', 'add11'): (0, 4, 7, 5), ('maj', '#11'): (0, 4, 7, 11, 6), ('maj', '13'): (0, 4, 7, 11, 2, 9),
+    ('min', 'm7'): (0, 3, 7, 10), ('min', 'm9'): (0, 3, 7, 10, 2), ('min', 'm11'): (0, 3, 7, 10, 2, 5),
+    ('min', 'm6'): (0, 3, 7, 9), ('min', 'madd9'): (0, 3, 7, 2), ('min', 'sus2'): (0, 2, 7),
+    ('min', 'sus4'): (0, 5, 7), ('min', 'madd11'): (0, 3, 7, 5),
+    ('dom', '7'): (0, 4, 7, 10), ('dom', '9'): (0, 4, 7, 10, 2), ('dom', '11'): (0, 7, 10, 2, 5),
+    ('dom', '13'): (0, 4, 7, 10, 2, 9), ('dom', '7sus4'): (0, 5, 7, 10), ('dom', '7b9'): (0, 4, 7, 10, 1),
+    ('dom', '7#9'): (0, 4, 7, 10, 3), ('dom', '7#11'): (0, 4, 7, 10, 6), ('dom', '7b13'): (0, 4, 7, 10, 8),
+    ('dom', '7alt'): (0, 4, 10, 1, 8), ('dom', 'sus4'): (0, 5, 7),
+    ('dim', 'dim7'): (0, 3, 6, 9), ('dim', 'm7b5'): (0, 3, 6, 10),
+    ('aug', 'maj7#5'): (0, 4, 8, 11), ('aug', '+7'): (0, 4, 8, 10),
+}
+
+TRIAD_SUFFIX = {'maj': '', 'min': 'm', 'dom': '', 'dim': 'dim', 'aug': 'aug'}
+
+# Style costs per chord (in semitones of voice movement, so they trade off against voice leading)
+TRIAD_COST = 0.5
+SAME_ROOT_COST = 1.5
+REPEAT_COST = 3.0
+RETURN_COST = 1.0
+UNRESOLVED_END_COST = 2.0
+# Borrowed-chord cost, from MAX_BORROW_COST at borrow weight 0 down to MIN_BORROW_COST at 1;
+# artists with borrowed notes but no weight (say from an older profile) count as occasional
+MIN_BORROW_COST = 0.5
+MAX_BORROW_COST = 5.0
+DEFAULT_BORROW_WEIGHT = 0.4
+
+# RINGS[pc][d]: bitmask of the pitch classes d semitones from pc, either way round
+RINGS = [[(1 << (pc + d) % 12) | (1 << (pc - d) % 12) for d in range(7)] for pc in range(12)]
+
+def pcs_mask(pcs):
+    mask = 0
+    for pc in pcs:
+        mask |= 1 << pc
+    return mask
+
+@lru_cache(maxsize=65536)
+def voice_leading_distance(a, b):
+    """Semitones voices move between two pitch-class sets (each a sorted tuple).
+
+    Every note walks to the nearest note of the other chord, in both directions, halved: 0 for
+    the same chord, small for chords sharing most notes.
+    """
+    a_mask, b_mask = pcs_mask(a), pcs_mask(b)
+    total = 0
+    for pcs, other in ((a, b_mask), (b, a_mask)):
+        for pc in pcs:
+            for d, ring in enumerate(RINGS[pc]):
+                if other & ring:
+                    total += d
+                    break
+    return total / 2
+
+def borrow_cost(style, context):
+    """Cost of a borrowed chord for an artist in a "major_key"/"minor_key" context, or None if they don't borrow.
+
+    Artists borrow in the contexts their artist_borrowed_chords_data notes cover, unless their
+    borrow weight is 0.
+    """
+    if not artist_borrowed_chords_data.get(style, {}).get(context):
+        return None
+    weight = artist_borrow_weights.get(style, DEFAULT_BORROW_WEIGHT)
+    if weight <= 0:
+        return None
+    return MAX_BORROW_COST - weight * (MAX_BORROW_COST - MIN_BORROW_COST)
+
+def chord_vocabulary(root, scale_type, style):
+    """Returns [(name, pitch classes, style cost, (chord_root, quality))] usable in the key.
+
+    The tonic triad comes first. Voicings with the same notes as an earlier entry (say a sus2
+    chord that is also in the parallel key) are left out.
+    """
+    chords, extensions, borrowed = adaptation_table(root, scale_type, style)
+    diatonic = [chord for chord in chords if isinstance(chord, tuple)]
+    if not diatonic:
+        raise ValueError(f"no chord table for {scale_type!r}, so no progressions can be built")
+    artist_extensions = {(chord_root, quality): exts for chord_root, quality, exts in extensions}
+
+    def variants(chord_root, quality, base_cost, exts):
+        root_pc = note_to_index_map[chord_root]
+        def pcs(intervals):
+            return tuple(sorted({(root_pc + i) % 12 for i in intervals}))
+        yield f"{chord_root}{TRIAD_SUFFIX[quality]}", pcs(QUALITY_INTERVALS[quality]), base_cost + TRIAD_COST, (chord_root, quality)
+        for ext in exts:
+            intervals = EXTENSION_INTERVALS.get((quality, ext))
+            if intervals:
+                yield f"{chord_root}{ext}", pcs(intervals), base_cost, (chord_root, quality)
+
+    vocabulary = []
+    voicings = set()
+    def add(chords):
+        for chord in chords:
+            if chord[1] not in voicings:
+                voicings.add(chord[1])
+                vocabulary.append(chord)
+
+    for chord_root, quality in diatonic:
+        add(variants(chord_root, quality, 0.0, artist_extensions.get((chord_root, quality), ())))
+
+    # Borrowed chords come from the parallel key: minor for major-like scales and vice versa
+    if borrowed:
+        context, _ = borrowed
+        cost = borrow_cost(style, f"{context}_key")
+        parallel = "natural_minor" if context == "major" else "major"
+        seen = {(chord_root, quality) for chord_root, quality in diatonic}
+        by_quality = {}
+        for chord_root, quality, exts in adaptation_table(root, parallel, style)[1]:
+            by_quality[(chord_root, quality)] = exts
+        for chord_root, quality in chords_in_scale(scale_generator(root, parallel), parallel):
+            if (chord_root, quality) not in seen and cost is not None:
+                add(variants(chord_root, quality, cost, by_quality.get((chord_root, quality), ())))
+    return vocabulary
+
+def iter_progressions(root, scale_type, style=None, length=8, top=10, beam=64):
+    """Lazily yields the best (cost, [chord names]) progressions, lowest cost first."""
+    if top < 1 or beam < 1:
+        raise ValueError("top and beam must be at least 1")
+    if length < 1:
+        return
+    vocabulary = chord_vocabulary(root, scale_type, style)
+    size = len(vocabulary)
+    tonic = vocabulary[0][3]
+    # Memoized voice leading, expanded into a table once per vocabulary; each chord's successors
+    # are kept sorted by cost so the search below can stop early
+    successors = []
+    for a in vocabulary:
+        row = []
+        for j, b in enumerate(vocabulary):
+            cost = voice_leading_distance(a[1], b[1]) + b[2]
+            if a[3][0] == b[3][0]:
+                cost += REPEAT_COST if a is b else SAME_ROOT_COST
+            row.append((cost, j))
+        row.sort()
+        successors.append(row)
+    end_cost = [0.0 if chord[3] == tonic else UNRESOLVED_END_COST for chord in vocabulary]
+
+    # States are (cost so far, chord indices), cheapest first; start on any tonic voicing
+    states = sorted((vocabulary[i][2], (i,)) for i in range(size) if vocabulary[i][3] == tonic)
+    for _ in range(length - 1):
+        kept = []  # max-heap of the best `beam` extensions, as (-cost, path)
+        for cost, path in states:
+            if len(kept) == beam and cost >= -kept[0][0]:
+                break
+            back = path[-2] if len(path) > 1 else None
+            for step, j in successors[path[-1]]:
+                total = cost + step
+                if len(kept) == beam and total >= -kept[0][0]:
+                    break
+                if j == back:
+                    total += RETURN_COST
+                    if len(kept) == beam and total >= -kept[0][0]:
+                        continue
+                if len(kept) < beam:
+                    heapq.heappush(kept, (-total, path + (j,)))
+                else:
+                    heapq.heapreplace(kept, (-total, path + (j,)))
+        states = sorted((-cost, path) for cost, path in kept)
+
+    finished = ((cost + end_cost[path[-1]], path) for cost, path in states)
+    for cost, path in heapq.nsmallest(top, finished):
+        yield round(cost, 3), [vocabulary[i][0] for i in path]
+
+def suggest_progressions(root, scale_type, style=None, length=8, top=10, beam=64):
+    """The top progressions as a list; see iter_progressions."""
+    return list(iter_progressions(root, scale_type, style, length, top, beam))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m indienizer.progressions",
+                                     description="Suggest chord progressions for a key and artist style.")
+    parser.add_argument("root", type=str.upper, choices=notes_list)
+    parser.add_argument("scale_type")
+    parser.add_argument("-s", "--style", choices=list(style_scales.keys()))
+    parser.add_argument("-n", "--length", type=int, default=8, help="chords per progression (default: 8)")
+    parser.add_argument("-k", "--top", type=int, default=5, help="how many progressions (default: 5)")
+    parser.add_argument("--beam", type=int, default=64, help="partial progressions kept per step (default: 64)")
+    args = parser.parse_args(argv)
+    try:
+        for cost, chords in iter_progressions(args.root, args.scale_type, args.style, args.length, args.top, args.beam):
+            print(f"{cost:7.2f}  " + " - ".join(chords))
+    except ValueError as e:
+        parser.error(str(e))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Ranked, fuzzy scale matching.
+
+find_possible_scales only keeps scales that contain every note, so one passing note wipes out
+every result. rank_scales instead scores all 12 x len(scale_patterns) candidates by how much of
+the (optionally weighted) input they cover:
+
+    score = (weight inside scale - out_penalty * weight outside scale) / total weight
+            - spread_penalty * (scale tones not played) / 12
+
+A scale containing every note scores 1 minus its spread term, so exact matches still come first.
+Equal scores (relative major/minor, modes of the same notes) go to the scale whose root carries
+the most weight, as in indienizer.keys, then to scale_index order.
+With NumPy installed the scoring is one matrix product over a precomputed (scales x 12) membership
+matrix, for a single note set or a whole batch (e.g. one row per bar); without it a pure-Python
+loop gives the same scores.
+"""
+
+import heapq
+
+from indienizer import core
+from indienizer.core import note_to_index_map, notes_list, scale_index
+
+try:
+    import numpy as np
+except ImportError:  # optional: the pure-Python path below gives identical rankings
+    np = None
+
+# Derived from core.scale_index; rebuilt by scale_tables() when core.scale_index_version changes
+tables_version = None
+scale_sizes = []  # distinct pitch classes per indexed scale, in scale_index order
+root_pcs = []  # pitch class of each indexed scale's root
+membership = membership_sizes = None
+
+def scale_tables():
+    """Refreshes scale_sizes and, with NumPy, the (scales x 12) membership matrix if the index changed."""
+    global tables_version, scale_sizes, root_pcs, membership, membership_sizes
+    if tables_version == core.scale_index_version:
+        return
+    scale_sizes = [bin(mask).count("1") for _, _, _, mask in scale_index]
+    root_pcs = [note_to_index_map[root] for root, _, _, _ in scale_index]
+    if np is not None:
+        # membership[s, pc] == 1.0 when pitch class pc is in scale_index[s]
+        membership = np.array(
+            [[(mask >> pc) & 1 for pc in range(len(notes_list))] for _, _, _, mask in scale_index],
+            dtype=np.float64,
+        )
+        membership_sizes = np.array(scale_sizes, dtype=np.float64)
+    tables_version = core.scale_index_version
+
+def note_weights(notes):
+    """Turns note names (repeats count as frequency) or a {note: weight} dict into 12 pitch-class weights.
+
+    Weights can be counts, durations or anything else non-negative. Raises ValueError on unknown notes.
+    """
+    items = notes.items() if isinstance(notes, dict) else ((n, 1.0) for n in notes)
+    weights = [0.0] * len(notes_list)
+    for note, weight in items:
+        index = note_to_index_map.get(note.upper())
+        if index is None:
+            raise ValueError(f"unknown note: {note!r}")
+        weights[index] += weight
+    return weights
+
+def allowed_rows(allowed_scales):
+    """Indices into scale_index kept by an allowed_scales filter (falsy = every scale)."""
+    return [
+        row for row, (_, scale_type, _, _) in enumerate(scale_index)
+        if not allowed_scales or scale_type in allowed_scales
+    ]
+
+def score_python(weights, rows, out_penalty, spread_penalty):
+    """Pure-Python scores for one 12-element weight vector over the given scale rows."""
+    total = sum(weights)
+    played = [pc for pc, weight in enumerate(weights) if weight > 0]
+    scores = []
+    for row in rows:
+        mask = scale_index[row][3]
+        inside = sum(weights[pc] for pc in played if mask >> pc & 1)
+        used = sum(1 for pc in played if mask >> pc & 1)
+        outside = total - inside
+        scores.append((inside - out_penalty * outside) / total
+                      - spread_penalty * (scale_sizes[row] - used) / len(notes_list))
+    return scores
+
+def score_numpy(weight_matrix, rows, out_penalty, spread_penalty):
+    """Scores a (sets x 12) weight matrix against the given scale rows in one matrix product."""
+    member = membership[rows]
+    totals = weight_matrix.sum(axis=1, keepdims=True)
+    inside = weight_matrix @ member.T
+    used = (weight_matrix > 0).astype(np.float64) @ member.T
+    outside = totals - inside
+    return ((inside - out_penalty * outside) / totals
+            - spread_penalty * (membership_sizes[rows] - used) / len(notes_list))
+
+def top_k(scores, rows, k, weights):
+    """The k best (score, root, scale_type, scale_notes), highest first.
+
+    Scores are compared as reported (rounded), so float noise can't split a tie; ties go to the
+    root with the most weight, then keep scale_index order.
+    """
+    rounded = [round(float(score), 6) for score in scores]
+    order = heapq.nsmallest(k, range(len(rows)), key=lambda i: (-rounded[i], -weights[root_pcs[rows[i]]]))
+    results = []
+    for i in order:
+        root, scale_type, scale_notes, _ = scale_index[rows[i]]
+        results.append((rounded[i], root, scale_type, list(scale_notes)))
+    return results
+
+def rank_scales_batch(note_sets, allowed_scales=None, top=10, out_penalty=1.0, spread_penalty=0.05):
+    """Ranks scales for many note sets (e.g. one per bar) at once.
+
+    Each note set is anything note_weights accepts. Returns one top-k list per note set;
+    empty note sets get an empty list.
+    """
+    scale_tables()
+    rows = allowed_rows(allowed_scales)
+    weight_rows = [note_weights(notes) for notes in note_sets]
+    if not rows or not weight_rows:
+        return [[] for _ in weight_rows]
+
+    if np is not None:
+        weight_matrix = np.array(weight_rows, dtype=np.float64)
+        nonempty = weight_matrix.sum(axis=1) > 0
+        scores = np.zeros((len(weight_rows), len(rows)))
+        if nonempty.any():
+            scores[nonempty] = score_numpy(weight_matrix[nonempty], rows, out_penalty, spread_penalty)
+        return [top_k(scores[i].tolist(), rows, top, weight_rows[i]) if nonempty[i] else []
+                for i in range(len(weight_rows))]
+
+    return [
+        top_k(score_python(weights, rows, out_penalty, spread_penalty), rows, top, weights)
+        if sum(weights) > 0 else []
+        for weights in weight_rows
+    ]
+
+def rank_scales(notes, allowed_scales=None, top=10, out_penalty=1.0, spread_penalty=0.05):
+    """Returns the top (score, root, scale_type, scale_notes) candidates for one note set.
+
+    notes is a list of note names (repeats weigh more) or a {note: weight} dict of counts/durations.
+    """
+    return rank_scales_batch([notes], allowed_scales, top, out_penalty, spread_penalty)[0]
@@ -0,0 +1,319 @@
+"""Loads, validates and compiles scale/style tables from JSON or TOML profile files.
+
+A profile file can hold any of the core table names (scale_patterns, chord_types_map,
+extension_compatibility, style_scales, artist_extensions_data, artist_borrowed_chords_data,
+artist_borrow_weights) and/or an "artists" section, which is easier to write by hand:
+
+    [artists."Phoebe Bridgers"]
+    scales = ["aeolian", "dorian", "mixolydian"]
+    extensions = ["maj7", "m7", "sus2"]
+    borrowed.major_key = ["Common: minor iv (e.g., Fm in C Major)"]
+    borrow_weight = 0.6    # 0 (never borrows) to 1 (constantly), for chord progressions
+
+Entries are layered over the built-in tables, so a file only needs what it adds or changes.
+The merged tables are validated and pickled to a cache directory, reused until the source
+file (mtime/size, then content hash) or the built-in tables change. install() hands them to
+indienizer.core, whose scale index (a pitch-class mask per scale plus per-note posting lists)
+and per-style extension cache are the compiled form every lookup actually uses.
+
+    python -m indienizer.registry --check profiles.toml
+    python -m indienizer.registry --dump > profiles.json
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import pickle
+import sys
+from functools import lru_cache
+
+from indienizer import core
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: JSON profiles still work
+    tomllib = None
+
+TABLE_NAMES = (
+    "scale_patterns", "chord_types_map", "extension_compatibility",
+    "style_scales", "artist_extensions_data", "artist_borrowed_chords_data", "artist_borrow_weights",
+)
+BORROWED_KEYS = ("major_key", "minor_key")
+# Bump when the cached layout changes, so old cache files are ignored
+COMPILED_FORMAT = 3
+
+# The built-in tables as shipped, copied before any Registry.install() replaces core's contents,
+# so every profile is layered over the same base however many have been installed
+BUILTIN_TABLES = copy.deepcopy({name: getattr(core, name) for name in TABLE_NAMES})
+
+def default_tables():
+    """A fresh copy of the built-in tables, to merge a profile into."""
+    return copy.deepcopy(BUILTIN_TABLES)
+
+def tables_digest(tables):
+    """Content hash of a set of tables, so cached builds notice edits to the built-in ones."""
+    return hashlib.sha256(json.dumps(tables, sort_keys=True).encode("utf-8")).hexdigest()
+
+@lru_cache(maxsize=1)
+def builtin_digest():
+    return tables_digest(BUILTIN_TABLES)
+
+def read_profile(path):
+    """Parses a .json or .toml profile file into a dict."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.lower().endswith(".toml"):
+        if tomllib is None:
+            raise ValueError("TOML profiles need Python 3.11+ (tomllib); use JSON instead")
+        return tomllib.loads(data.decode("utf-8"))
+    return json.loads(data)
+
+def merge_profile(tables, profile):
+    """Layers a parsed profile over tables (in place) and returns them."""
+    if not isinstance(profile, dict):
+        raise ValueError("a profile must be a JSON object / TOML table")
+    unknown = set(profile) - set(TABLE_NAMES) - {"artists"}
+    if unknown:
+        raise ValueError(f"unknown profile sections: {', '.join(sorted(unknown))}")
+    for name in TABLE_NAMES:
+        section = profile.get(name, {})
+        if not isinstance(section, dict):
+            raise ValueError(f"{name} must be a table of entries")
+        tables[name].update(section)
+    artists = profile.get("artists", {})
+    if not isinstance(artists, dict):
+        raise ValueError("artists must be a table of artist entries")
+    for artist, entry in artists.items():
+        if not isinstance(entry, dict):
+            raise ValueError(f"artists.{artist} must be a table")
+        for field in ("scales", "extensions"):
+            if not is_string_list(entry.get(field, [])):
+                raise ValueError(f"artists.{artist}.{field} must be a list of strings")
+        borrowed = entry.get("borrowed", {})
+        if not isinstance(borrowed, dict):
+            raise ValueError(f"artists.{artist}.borrowed must be a table with {' / '.join(BORROWED_KEYS)}")
+        for key in BORROWED_KEYS:
+            if not is_string_list(borrowed.get(key, [])):
+                raise ValueError(f"artists.{artist}.borrowed.{key} must be a list of strings")
+        if "borrow_weight" in entry and not is_number(entry["borrow_weight"]):
+            raise ValueError(f"artists.{artist}.borrow_weight must be a number from 0 to 1")
+        tables["style_scales"][artist] = entry.get("scales", [])
+        tables["artist_extensions_data"][artist] = entry.get("extensions", [])
+        tables["artist_borrowed_chords_data"][artist] = {key: borrowed.get(key, []) for key in BORROWED_KEYS}
+        if "borrow_weight" in entry:
+            tables["artist_borrow_weights"][artist] = entry["borrow_weight"]
+        else:
+            tables["artist_borrow_weights"].pop(artist, None)
+    return tables
+
+def is_string_list(value):
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+def triad_quality(degrees, i):
+    """Chord quality built by stacking scale thirds on degree i (degrees in semitones from the root)."""
+    n = len(degrees)
+    third, fifth, seventh = ((degrees[(i + step) % n] - degrees[i]) % 12 for step in (2, 4, 6))
+    if (third, fifth) == (4, 7):
+        return "dom" if seventh == 10 else "maj"
+    return {(3, 7): "min", (3, 6): "dim", (4, 8): "aug"}.get((third, fifth))
+
+def scale_degrees(pattern):
+    """Semitone offsets of each scale degree from the root, e.g. major -> [0, 2, 4, 5, 7, 9, 11]."""
+    degrees = [0]
+    for interval in pattern[:-1]:
+        degrees.append(degrees[-1] + interval)
+    return degrees
+
+def is_int_list(value):
+    return isinstance(value, list) and all(isinstance(item, int) and not isinstance(item, bool) for item in value)
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def shape_errors(tables):
+    """Entries of the wrong type, which the consistency checks below can't even read."""
+    errors = []
+    for name in TABLE_NAMES:
+        if not isinstance(tables.get(name), dict):
+            errors.append(f"{name} must be a table of entries")
+    if errors:
+        return errors
+    for key, value in tables["scale_patterns"].items():
+        if not is_int_list(value):
+            errors.append(f"scale_patterns.{key} must be a list of integers")
+    for name in ("chord_types_map", "extension_compatibility", "style_scales", "artist_extensions_data"):
+        for key, value in tables[name].items():
+            if not is_string_list(value):
+                errors.append(f"{name}.{key} must be a list of strings")
+    for key, value in tables["artist_borrowed_chords_data"].items():
+        if not isinstance(value, dict):
+            errors.append(f"artist_borrowed_chords_data.{key} must be a table with {' / '.join(BORROWED_KEYS)}")
+            continue
+        for context, descriptions in value.items():
+            if not is_string_list(descriptions):
+                errors.append(f"artist_borrowed_chords_data.{key}.{context} must be a list of strings")
+    for key, value in tables["artist_borrow_weights"].items():
+        if not is_number(value):
+            errors.append(f"artist_borrow_weights.{key} must be a number")
+    return errors
+
+def validate_tables(tables):
+    """Checks the tables for consistency.
+
+    Raises ValueError listing every error; returns a list of warnings for things that work but
+    look unintended (a style scale without a chord table, a 'maj' chord whose scale 7th is minor).
+    """
+    errors = shape_errors(tables)
+    if errors:
+        raise ValueError("invalid tables:\n  " + "\n  ".join(errors))
+    warnings = []
+    patterns = tables["scale_patterns"]
+    compatibility = tables["extension_compatibility"]
+    styles = tables["style_scales"]
+
+    for scale_type, pattern in patterns.items():
+        if not pattern or not all(isinstance(i, int) and i > 0 for i in pattern):
+            errors.append(f"scale_patterns.{scale_type}: intervals must be positive integers")
+        elif sum(pattern) != 12:
+            errors.append(f"scale_patterns.{scale_type}: intervals add up to {sum(pattern)}, not 12")
+
+    for scale_type, qualities in tables["chord_types_map"].items():
+        pattern = patterns.get(scale_type)
+        if pattern is None:
+            errors.append(f"chord_types_map.{scale_type}: no such scale in scale_patterns")
+            continue
+        if len(qualities) != len(pattern):
+            errors.append(f"chord_types_map.{scale_type}: {len(qualities)} chords for {len(pattern)} scale degrees")
+            continue
+        degrees = scale_degrees(pattern)
+        for i, quality in enumerate(qualities):
+            if quality not in compatibility:
+                errors.append(f"chord_types_map.{scale_type}[{i}]: unknown chord quality {quality!r}")
+                continue
+            built = triad_quality(degrees, i)
+            if {quality, built} == {"maj", "dom"}:
+                warnings.append(f"chord_types_map.{scale_type}[{i}]: listed as {quality!r} but the scale's 7th makes it {built!r}")
+            elif quality != built:
+                errors.append(f"chord_types_map.{scale_type}[{i}]: listed as {quality!r} but the scale builds {built or 'no standard triad'}")
+
+    all_extensions = {ext for suffixes in compatibility.values() for ext in suffixes}
+    for style, scale_types in styles.items():
+        for scale_type in scale_types:
+            if scale_type not in patterns:
+                errors.append(f"style_scales.{style}: unknown scale {scale_type!r}")
+            elif scale_type not in tables["chord_types_map"]:
+                warnings.append(f"style_scales.{style}: {scale_type!r} has no chord table, so no chords are listed for it")
+    for style, extensions in tables["artist_extensions_data"].items():
+        if style not in styles:
+            errors.append(f"artist_extensions_data.{style}: style has no style_scales entry")
+        for ext in extensions:
+            if ext not in all_extensions:
+                errors.append(f"artist_extensions_data.{style}: {ext!r} fits no chord quality")
+    for style, borrowed in tables["artist_borrowed_chords_data"].items():
+        if style not in styles:
+            errors.append(f"artist_borrowed_chords_data.{style}: style has no style_scales entry")
+        elif set(borrowed) - set(BORROWED_KEYS):
+            errors.append(f"artist_borrowed_chords_data.{style}: expected only {' / '.join(BORROWED_KEYS)}")
+    for style, weight in tables["artist_borrow_weights"].items():
+        if style not in styles:
+            errors.append(f"artist_borrow_weights.{style}: style has no style_scales entry")
+        elif not 0 <= weight <= 1:
+            errors.append(f"artist_borrow_weights.{style}: {weight} is outside 0 to 1")
+
+    if errors:
+        raise ValueError("invalid tables:\n  " + "\n  ".join(errors))
+    return warnings
+
+class Registry:
+    """Validated tables, ready to install into indienizer.core."""
+
+    def __init__(self, tables, warnings=()):
+        self.tables = tables
+        self.warnings = list(warnings)
+
+    def install(self):
+        """Makes these tables the ones indienizer.core (and so the GUI, CLI and server) uses."""
+        for name in TABLE_NAMES:
+            table = getattr(core, name)
+            table.clear()
+            table.update(self.tables[name])
+        core.rebuild_scale_index()
+
+def compile_tables(tables):
+    """Validates tables into a Registry."""
+    return Registry(tables, validate_tables(tables))
+
+def default_cache_dir():
+    return os.environ.get("INDIENIZER_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "indienizer")
+
+def load_registry(path=None, cache_dir=None):
+    """Loads a profile file layered over the built-in tables, compiling it or reusing the cached build.
+
+    The cache entry is reused as-is while the built-in tables and the file's mtime and size are
+    unchanged; otherwise the content hash decides whether it is still valid. With no path, the
+    built-in tables are compiled.
+    """
+    if path is None:
+        return compile_tables(default_tables())
+
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    cache_dir = cache_dir or default_cache_dir()
+    cache_path = os.path.join(cache_dir, hashlib.sha256(path.encode("utf-8")).hexdigest()[:16] + ".pickle")
+
+    cached = None
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+    if not cached or cached.get("format") != COMPILED_FORMAT or cached.get("builtin") != builtin_digest():
+        cached = None
+    elif (cached["mtime_ns"], cached["size"]) == (stat.st_mtime_ns, stat.st_size):
+        return cached["registry"]
+
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    if cached and cached["sha256"] == digest:
+        registry = cached["registry"]
+    else:
+        registry = compile_tables(merge_profile(default_tables(), read_profile(path)))
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"format": COMPILED_FORMAT, "builtin": builtin_digest(), "mtime_ns": stat.st_mtime_ns,
+                         "size": stat.st_size, "sha256": digest, "registry": registry}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # a read-only cache dir just means compiling every time
+    return registry
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m indienizer.registry",
+                                     description="Validate style/scale profile files or dump the built-in tables.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--check", metavar="PROFILE", help="validate and compile a .json/.toml profile")
+    group.add_argument("--dump", action="store_true", help="print the built-in tables as JSON")
+    args = parser.parse_args(argv)
+
+    if args.dump:
+        json.dump(BUILTIN_TABLES, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return 0
+    try:
+        registry = compile_tables(merge_profile(default_tables(), read_profile(args.check)))
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    for warning in registry.warnings:
+        print(f"warning: {warning}", file=sys.stderr)
+    print(f"ok: {len(registry.tables['scale_patterns'])} scale types, {len(registry.tables['style_scales'])} styles")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""Small asyncio HTTP/JSON service for the scale -> chords -> artist adaptation analysis.
+
+    python -m indienizer.server --port 8765
+
+    GET  /health                                   -> {"status": "ok", "cache": {...}}
+    POST /analyze {"notes": "C E G", "style": "SYML"}  -> one analyze_notes result
+    POST /batch   {"items": [{"notes": [...], "style": ...}, ...]} -> {"results": [...]}
+
+Requests are keyed by their normalized (note set, style): notes are upper-cased, de-duplicated
+and put in notes_list order, so "g c e" and "C E G" share a cache entry and a response.
+Concurrent requests are coalesced: keys arriving within max_delay of each other are analyzed
+together once, and every waiter on the same key gets the same encoded result. Finished results
+are kept in a bounded LRU of encoded JSON, so repeat requests skip both analysis and encoding.
+
+Standard library only and no tkinter, so it runs on headless machines.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import OrderedDict
+
+from indienizer.core import analyze_notes, note_to_index_map, notes_list, style_scales
+from indienizer.registry import load_registry
+
+MAX_BODY_BYTES = 8 * 1024 * 1024
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 411: "Length Required",
+           413: "Payload Too Large"}
+
+def normalize_request(item):
+    """Turns a {"notes", "style"} request into a hashable (notes tuple, style) key.
+
+    Raises ValueError with a client-facing message when the request is malformed.
+    """
+    if not isinstance(item, dict):
+        raise ValueError("each request must be a JSON object")
+    if "notes" not in item:
+        raise ValueError("notes is required")
+    notes = item["notes"]
+    if isinstance(notes, str):
+        notes = notes.replace(",", " ").split()
+    if not isinstance(notes, list) or not all(isinstance(n, str) for n in notes):
+        raise ValueError("notes must be a string or a list of strings")
+    if not notes:
+        # Every scale contains the empty set, so it would match all of them
+        raise ValueError("no notes given")
+    style = item.get("style")
+    if style is not None and not isinstance(style, str):
+        raise ValueError("style must be a string")
+    if style is not None and style not in style_scales:
+        raise ValueError(f"unknown style: {style}")
+
+    upper = {n.upper() for n in notes}
+    unknown = sorted(upper - note_to_index_map.keys())
+    # Unknown notes can never match a scale; keep them (sorted, after the known ones) so the
+    # response still shows what was asked for
+    known = tuple(n for n in notes_list if n in upper)
+    return known + tuple(unknown), style
+
+def encode(obj):
+    """Compact UTF-8 JSON bytes."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+class AnalysisBatcher:
+    """Coalesces concurrent analysis requests and caches their encoded results."""
+
+    def __init__(self, max_batch=512, max_delay=0.001, cache_size=65536):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.waiting = {}  # key -> future shared by everyone asking for it
+        self.flush_handle = None
+        self.hits = self.misses = self.coalesced = self.batches = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "coalesced": self.coalesced,
+                "batches": self.batches, "size": len(self.cache), "maxsize": self.cache_size}
+
+    def analyze(self, key):
+        """Returns a future for the encoded result of one normalized key."""
+        loop = asyncio.get_running_loop()
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            future = loop.create_future()
+            future.set_result(cached)
+            return future
+
+        future = self.waiting.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            future = self.waiting[key] = loop.create_future()
+            if len(self.waiting) >= self.max_batch:
+                self.flush()
+            elif self.flush_handle is None:
+                self.flush_handle = loop.call_later(self.max_delay, self.flush)
+        return future
+
+    def flush(self):
+        """Analyzes every waiting key once and resolves its future."""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        waiting, self.waiting = self.waiting, {}
+        if not waiting:
+            return
+        self.batches += 1
+        for key, future in waiting.items():
+            notes, style = key
+            result = encode(analyze_notes(notes, style))
+            self.cache[key] = result
+            if not future.done():
+                future.set_result(result)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+class AnalysisServer:
+    """HTTP/1.1 (keep-alive) front end for an AnalysisBatcher."""
+
+    def __init__(self, batcher=None):
+        self.batcher = batcher or AnalysisBatcher()
+
+    async def handle_analyze(self, payload):
+        key = normalize_request(payload)
+        return await self.batcher.analyze(key)
+
+    async def handle_batch(self, payload):
+        items = payload.get("items") if isinstance(payload, dict) else None
+        if not isinstance(items, list):
+            raise ValueError('expected {"items": [...]}')
+        futures = []
+        for item in items:
+            try:
+                futures.append(self.batcher.analyze(normalize_request(item)))
+            except ValueError as e:
+                futures.append(encode({"error": str(e)}))
+        parts = [f if isinstance(f, bytes) else await f for f in futures]
+        return b'{"results":[' + b",".join(parts) + b"]}"
+
+    async def route(self, method, path, body):
+        """Returns (status, JSON bytes) for one request."""
+        if path == "/health":
+            if method != "GET":
+                return 405, encode({"error": "use GET"})
+            return 200, encode({"status": "ok", "cache": self.batcher.stats()})
+        handler = {"/analyze": self.handle_analyze, "/batch": self.handle_batch}.get(path)
+        if handler is None:
+            return 404, encode({"error": f"no such endpoint: {path}"})
+        if method != "POST":
+            return 405, encode({"error": "use POST"})
+        try:
+            return 200, await handler(json.loads(body or b"{}"))
+        except ValueError as e:  # includes json.JSONDecodeError
+            return 400, encode({"error": str(e)})
+        except RecursionError:  # json.loads on absurdly deep nesting
+            return 400, encode({"error": "request JSON is nested too deeply"})
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                length = headers.get("content-length", "0")
+                length = int(length) if length.isdigit() else -1
+                if "transfer-encoding" in headers:
+                    # Chunked bodies aren't supported, and without a length the body can't be skipped
+                    status, keep_alive = 411, False
+                    body = encode({"error": "send a Content-Length, not Transfer-Encoding"})
+                elif length < 0:
+                    status, body, keep_alive = 400, encode({"error": "bad Content-Length"}), False
+                elif length > MAX_BODY_BYTES:
+                    status, body, keep_alive = 413, encode({"error": "request body too large"}), False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, body = await self.route(method, target.split("?", 1)[0], body)
+
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        """Starts listening; returns the asyncio server."""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+async def serve_forever(host, port):
+    server = await AnalysisServer().serve(host, port)
+    addresses = ", ".join(f"{s.getsockname()[0]}:{s.getsockname()[1]}" for s in server.sockets)
+    print(f"INDIENIZER analysis service on {addresses}")
+    async with server:
+        await server.serve_forever()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m indienizer.server", description="Serve the analysis over HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--styles", metavar="PROFILE",
+                        help="JSON/TOML style profile to load on top of the built-in artists")
+    args = parser.parse_args(argv)
+    if args.styles:
+        try:
+            load_registry(args.styles).install()
+        except (OSError, ValueError) as e:
+            parser.error(f"--styles: {e}")
+    try:
+        asyncio.run(serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
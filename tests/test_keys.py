@@ -0,0 +1,76 @@
+"""Tests for sliding-window key detection against a from-scratch recount of every window."""
+
+import unittest
+from collections import Counter
+
+from indienizer.core import notes_list, scale_generator, scale_patterns
+from indienizer.keys import DEFAULT_KEY_SCALES, iter_key_changes, key_regions
+
+# Eight bars of C major, then eight of E major (four sharps the C major window doesn't have)
+C_MAJOR = "C E G E F A G C D F E G C G E C".split() * 2
+E_MAJOR = "E G# B G# A C# B E F# A G# B E B G# E D#".split() * 2
+STREAM = list(enumerate(C_MAJOR + E_MAJOR))
+
+def brute_force_changes(events, window, allowed_scales, hop):
+    """The key changes iter_key_changes should report, recounting every judged window from scratch."""
+    candidates = [(root, scale_type, set(scale_generator(root, scale_type)))
+                  for root in notes_list for scale_type in scale_patterns if scale_type in allowed_scales]
+    order = list(allowed_scales)
+
+    def score(candidate, notes):
+        root, scale_type, scale = candidate
+        inside = sum(note in scale for note in notes)
+        return inside, Counter(notes)[root], -order.index(scale_type), -len(scale)
+
+    changes = []
+    current = None
+
+    def judge(time, notes):
+        nonlocal current
+        scores = [score(candidate, notes) for candidate in candidates]
+        best = scores.index(max(scores))
+        if current is not None and scores[current][0] == scores[best][0]:
+            return
+        if best != current:
+            current = best
+            root, scale_type, _ = candidates[best]
+            changes.append((time, root, scale_type))
+
+    for i, (time, _) in enumerate(events):
+        if i + 1 >= window and (i + 1 - window) % hop == 0:
+            judge(time, [note for _, note in events[max(0, i + 1 - window):i + 1]])
+    if current is None and events:
+        judge(events[-1][0], [note for _, note in events])
+    return changes
+
+class KeyChangeTest(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        for window in (1, 4, 8, 16, 100):
+            for hop in (1, 3, 8):
+                with self.subTest(window=window, hop=hop):
+                    changes = [change[:3] for change in iter_key_changes(STREAM, window, DEFAULT_KEY_SCALES, hop)]
+                    self.assertEqual(changes, brute_force_changes(STREAM, window, DEFAULT_KEY_SCALES, hop))
+
+    def test_regions(self):
+        regions = key_regions(STREAM, window=8)
+        # Windows straddling the change may settle on a passing key in between
+        self.assertEqual((regions[0]["root"], regions[0]["scale_type"]), ("C", "major"))
+        self.assertEqual((regions[-1]["root"], regions[-1]["scale_type"]), ("E", "major"))
+        self.assertEqual(regions[0]["start"], 0)
+        self.assertEqual(regions[-1]["end"], len(STREAM) - 1)
+        for before, after in zip(regions, regions[1:]):
+            self.assertEqual(before["end"], after["start"])
+        self.assertEqual(regions[-1]["notes"], ["E", "F#", "G#", "A", "B", "C#", "D#"])
+        self.assertIn(["B", "dom"], regions[-1]["chords"])
+
+    def test_window_and_hop_must_be_positive(self):
+        for window, hop in ((0, 1), (-1, 1), (8, 0)):
+            with self.subTest(window=window, hop=hop):
+                with self.assertRaises(ValueError):
+                    list(iter_key_changes(STREAM, window, hop=hop))
+                with self.assertRaises(ValueError):
+                    key_regions(STREAM, window, hop=hop)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Tests for the streaming MIDI reader against a small hand-built fixture.
+
+fixtures/minimal.mid is a format-1 file at 96 ticks per quarter note. Track 1 holds a name,
+4/4, a tempo and a change to 3/4 at bar 2. Track 2 has a sysex message, then:
+  bar 1  C and E (the E by running status), plus an F# note-on with velocity 0 (a note-off)
+  bar 2  G and B (running status), a text meta event, note-offs via 0x80 + running status
+  bar 3  D at tick 672, which is bar 3 only if the 3/4 change is honoured, and a drum hit
+"""
+
+import os
+import tempfile
+import unittest
+
+from indienizer.midi import analyze_midi_file, iter_note_events, window_masks
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "minimal.mid")
+
+class MinimalFileTest(unittest.TestCase):
+
+    def setUp(self):
+        with open(FIXTURE, "rb") as f:
+            self.data = f.read()
+
+    def test_note_events(self):
+        # C=0, E=4, G=7, B=11, D=2; no F# (velocity 0) and no drum hit
+        self.assertEqual(list(iter_note_events(self.data)), [(0, 0), (0, 4), (384, 7), (384, 11), (672, 2)])
+
+    def test_windows_follow_time_signature(self):
+        song_mask, windows = window_masks(self.data)
+        self.assertEqual(song_mask, 1 << 0 | 1 << 2 | 1 << 4 | 1 << 7 | 1 << 11)
+        self.assertEqual(windows, {0: 1 << 0 | 1 << 4, 1: 1 << 7 | 1 << 11, 2: 1 << 2})
+
+    def test_analyze_file(self):
+        result = analyze_midi_file(FIXTURE, bars_per_window=1, allowed_scales=["major"])
+        self.assertEqual(result["notes"], ["C", "D", "E", "G", "B"])
+        self.assertEqual(result["scales"], [["C", "major"], ["G", "major"]])
+        self.assertEqual([w["bar"] for w in result["windows"]], [1, 2, 3])
+        self.assertEqual(result["windows"][2]["notes"], ["D"])
+
+    def test_windows_need_at_least_one_bar(self):
+        for bars in (0, -1):
+            with self.assertRaises(ValueError):
+                window_masks(self.data, bars)
+
+class DrumOnlyFileTest(unittest.TestCase):
+
+    def test_no_pitched_notes_match_no_scales(self):
+        events = bytes([0x00, 0x99, 36, 100, 0x60, 0x89, 36, 0, 0x00, 0xFF, 0x2F, 0x00])
+        data = (b"MThd" + (6).to_bytes(4, "big") + bytes([0, 0, 0, 1, 0, 96])
+                + b"MTrk" + len(events).to_bytes(4, "big") + events)
+        with tempfile.NamedTemporaryFile(suffix=".mid", delete=False) as f:
+            f.write(data)
+        try:
+            result = analyze_midi_file(f.name)
+        finally:
+            os.unlink(f.name)
+        self.assertEqual(result["notes"], [])
+        self.assertEqual(result["scales"], [])
+        self.assertEqual(result["windows"], [])
+
+if __name__ == "__main__":
+    unittest.main()
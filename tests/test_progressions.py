@@ -0,0 +1,101 @@
+"""Tests for chord progression search against brute-force enumeration of every progression."""
+
+import itertools
+import unittest
+from unittest import mock
+
+from indienizer import progressions
+from indienizer.core import artist_borrow_weights
+from indienizer.progressions import borrow_cost, chord_vocabulary, suggest_progressions
+
+def distance(a, b):
+    """Voice leading from scratch: each note's nearest note in the other chord, both ways, halved."""
+    def nearest(pc, chord):
+        return min(min((pc - other) % 12, (other - pc) % 12) for other in chord)
+    return (sum(nearest(pc, b) for pc in a) + sum(nearest(pc, a) for pc in b)) / 2
+
+def path_cost(vocabulary, path):
+    """A progression's cost as the progressions module docstring defines it."""
+    chords = [vocabulary[i] for i in path]
+    cost = chords[0][2]
+    for step, (i, j) in enumerate(zip(path, path[1:])):
+        a, b = vocabulary[i], vocabulary[j]
+        cost += distance(a[1], b[1]) + b[2]
+        if i == j:
+            cost += progressions.REPEAT_COST
+        elif a[3][0] == b[3][0]:
+            cost += progressions.SAME_ROOT_COST
+        if step > 0 and j == path[step - 1]:
+            cost += progressions.RETURN_COST
+    if chords[-1][3] != vocabulary[0][3]:
+        cost += progressions.UNRESOLVED_END_COST
+    return round(cost, 3)
+
+def brute_force(vocabulary, length):
+    """Every progression's cost, starting on a tonic voicing, cheapest first."""
+    starts = [i for i, chord in enumerate(vocabulary) if chord[3] == vocabulary[0][3]]
+    paths = (
+        (start,) + rest
+        for start in starts
+        for rest in itertools.product(range(len(vocabulary)), repeat=length - 1)
+    )
+    return sorted(path_cost(vocabulary, path) for path in paths)
+
+class SearchTest(unittest.TestCase):
+
+    CASES = [
+        ("C", "major", None, 1),
+        ("C", "major", None, 4),
+        ("C", "major", "Phoebe Bridgers", 3),
+        ("A", "aeolian", "Leif Vollebekk", 3),
+        ("A", "aeolian", "Bon Iver", 3),
+    ]
+
+    def test_exhaustive_beam_matches_brute_force(self):
+        for root, scale_type, style, length in self.CASES:
+            with self.subTest(root=root, scale_type=scale_type, style=style, length=length):
+                vocabulary = chord_vocabulary(root, scale_type, style)
+                index = {chord[0]: i for i, chord in enumerate(vocabulary)}
+                self.assertEqual(len(index), len(vocabulary))
+                expected = brute_force(vocabulary, length)
+                found = suggest_progressions(root, scale_type, style, length, top=10,
+                                             beam=len(vocabulary) ** length)
+                self.assertEqual([cost for cost, _ in found], expected[:10])
+                for cost, names in found:
+                    self.assertEqual(path_cost(vocabulary, [index[name] for name in names]), cost)
+
+    def test_default_beam_never_beats_the_optimum(self):
+        for root, scale_type, style, length in self.CASES:
+            with self.subTest(root=root, scale_type=scale_type, style=style, length=length):
+                expected = brute_force(chord_vocabulary(root, scale_type, style), length)
+                found = suggest_progressions(root, scale_type, style, length, top=5, beam=4)
+                for (cost, _), best in zip(found, expected):
+                    self.assertGreaterEqual(cost, best)
+
+class BorrowCostTest(unittest.TestCase):
+
+    def test_cost_follows_weight(self):
+        # "Light to moderate" (Phoebe Bridgers) costs more than "Moderate" (Billie Eilish),
+        # which costs more than "Moderate to heavy" (Lana Del Rey)
+        costs = [borrow_cost(style, "major_key") for style in ("Lana Del Rey", "Billie Eilish", "Phoebe Bridgers",
+                                                               "London Grammar", "SYML", "Leif Vollebekk")]
+        self.assertEqual(costs, sorted(costs))
+        self.assertEqual(len(set(costs)), len(costs))
+        self.assertEqual(borrow_cost("Bon Iver", "minor_key"), progressions.MIN_BORROW_COST)
+
+    def test_who_borrows(self):
+        self.assertIsNone(borrow_cost("EMPTY", "major_key"))
+        self.assertIsNone(borrow_cost("SYML", "minor_key"))  # no minor-key notes
+        with mock.patch.dict(artist_borrow_weights, {"SYML": 0.0}):
+            self.assertIsNone(borrow_cost("SYML", "major_key"))
+        with mock.patch.dict(artist_borrow_weights):
+            del artist_borrow_weights["SYML"]
+            self.assertIsNotNone(borrow_cost("SYML", "major_key"))
+
+    def test_zero_weight_drops_borrowed_chords(self):
+        with_borrowing = len(chord_vocabulary("C", "major", "SYML"))
+        with mock.patch.dict(artist_borrow_weights, {"SYML": 0.0}):
+            self.assertLess(len(chord_vocabulary("C", "major", "SYML")), with_borrowing)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests for ranked scale matching: NumPy/pure-Python parity and ranking order."""
+
+import random
+import unittest
+from unittest import mock
+
+from indienizer import ranking
+from indienizer.core import find_possible_scales, notes_list
+from indienizer.ranking import rank_scales, rank_scales_batch
+
+def random_note_sets(count, seed=7):
+    rng = random.Random(seed)
+    return [{note: rng.choice((0.5, 1, 2, 3)) for note in rng.sample(notes_list, rng.randint(1, 9))}
+            for _ in range(count)]
+
+@unittest.skipIf(ranking.np is None, "NumPy is not installed")
+class NumpyParityTest(unittest.TestCase):
+
+    def test_scores_match_pure_python(self):
+        ranking.scale_tables()
+        rows = ranking.allowed_rows(None)
+        weight_rows = [ranking.note_weights(notes) for notes in random_note_sets(50)]
+        matrix = ranking.score_numpy(ranking.np.array(weight_rows, dtype=float), rows, 1.0, 0.05)
+        for weights, scores in zip(weight_rows, matrix):
+            expected = ranking.score_python(weights, rows, 1.0, 0.05)
+            for got, want in zip(scores.tolist(), expected):
+                self.assertAlmostEqual(got, want, places=9)
+
+    def test_rankings_match_without_numpy(self):
+        note_sets = random_note_sets(50) + [[]]
+        with_numpy = rank_scales_batch(note_sets, top=12)
+        with mock.patch.object(ranking, "np", None):
+            self.assertEqual(rank_scales_batch(note_sets, top=12), with_numpy)
+
+class RankingTest(unittest.TestCase):
+
+    def test_ties_go_to_the_heaviest_root(self):
+        # A, C#: harmonic minor both contain every note; A is played most
+        ranked = rank_scales({"A": 4, "C": 2, "E": 3, "G#": 0.5}, top=3)
+        self.assertEqual([(root, scale_type) for _, root, scale_type, _ in ranked],
+                         [("A", "harmonic_minor"), ("A", "melodic_minor_asc"), ("C#", "harmonic_minor")])
+        self.assertEqual(len({score for score, _, _, _ in ranked}), 1)
+
+    def test_relative_keys_follow_the_root(self):
+        scale = ["C", "D", "E", "F", "G", "A", "B"]
+        top = rank_scales(scale + ["A", "A"], allowed_scales=["major", "natural_minor"], top=1)
+        self.assertEqual(top[0][1:3], ("A", "natural_minor"))
+        top = rank_scales(scale + ["C", "C"], allowed_scales=["major", "natural_minor"], top=1)
+        self.assertEqual(top[0][1:3], ("C", "major"))
+
+    def test_exact_matches_come_first(self):
+        for notes in (["C", "E", "G"], ["A", "C", "D", "E", "G"], ["C", "D", "E", "F#", "G", "A", "B"]):
+            with self.subTest(notes=notes):
+                exact = {(root, scale_type) for root, scale_type, _ in find_possible_scales(notes)}
+                ranked = rank_scales(notes, top=len(exact) + 1)
+                self.assertEqual({(root, scale_type) for _, root, scale_type, _ in ranked[:len(exact)]}, exact)
+                self.assertGreater(ranked[len(exact) - 1][0], ranked[len(exact)][0])
+
+    def test_passing_note_keeps_results(self):
+        self.assertEqual(find_possible_scales(["C", "D", "E", "F", "G", "A", "B", "C#"]), [])
+        top = rank_scales(["C", "D", "E", "F", "G", "A", "B", "C", "C#"], allowed_scales=["major"], top=1)
+        self.assertEqual(top[0][1:3], ("C", "major"))
+
+    def test_edge_cases(self):
+        self.assertEqual(rank_scales([]), [])
+        self.assertEqual(rank_scales_batch([["C"], {}, ["E"]], allowed_scales=["major"], top=1)[1], [])
+        self.assertEqual(rank_scales(["C", "E"], allowed_scales=["no such scale"]), [])
+        with self.assertRaises(ValueError):
+            rank_scales(["C", "H"])
+
+if __name__ == "__main__":
+    unittest.main()
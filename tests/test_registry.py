@@ -0,0 +1,122 @@
+"""Tests for profile validation and the compiled-registry cache."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from indienizer import core, registry
+
+def check(profile):
+    return registry.compile_tables(registry.merge_profile(registry.default_tables(), profile))
+
+class ValidationTest(unittest.TestCase):
+
+    def test_builtin_tables_are_valid(self):
+        warnings = registry.validate_tables(registry.default_tables())
+        self.assertTrue(all(isinstance(w, str) for w in warnings))
+
+    def test_malformed_entries_raise_value_error(self):
+        for profile in (
+            {"scale_patterns": {"x": 5}},
+            {"scale_patterns": {"x": [True, 11]}},
+            {"chord_types_map": {"major": 5}},
+            {"artist_extensions_data": {"SYML": 3}},
+            {"style_scales": {"New": "aeolian"}},
+            {"artist_borrowed_chords_data": {"SYML": []}},
+            {"artist_borrowed_chords_data": {"SYML": {"major_key": "often"}}},
+            {"artists": ["x"]},
+            {"artists": {"x": {"borrowed": ["a"]}}},
+            {"artists": {"x": {"scales": "major"}}},
+            {"artists": {"x": {"borrow_weight": "often"}}},
+            {"artist_borrow_weights": {"SYML": "occasional"}},
+            {"artist_borrow_weights": {"SYML": True}},
+            {"style_scales": []},
+        ):
+            with self.subTest(profile=profile):
+                with self.assertRaises(ValueError):
+                    check(profile)
+
+    def test_inconsistent_tables_raise_value_error(self):
+        for profile, message in (
+            ({"scale_patterns": {"x": [2, 2, 2]}}, "add up to 6"),
+            ({"style_scales": {"New": ["nope"]}}, "unknown scale 'nope'"),
+            ({"artists": {"New": {"scales": ["major"], "extensions": ["maj13#5"]}}}, "fits no chord quality"),
+            ({"chord_types_map": {"major": ["min"] * 7}}, "listed as 'min'"),
+            ({"artist_borrow_weights": {"SYML": 1.5}}, "outside 0 to 1"),
+            ({"artist_borrow_weights": {"Nobody": 0.5}}, "no style_scales entry"),
+        ):
+            with self.subTest(profile=profile):
+                with self.assertRaisesRegex(ValueError, message):
+                    check(profile)
+
+    def test_artists_section(self):
+        tables = check({"artists": {"New": {"scales": ["major"], "extensions": ["maj7"],
+                                            "borrowed": {"major_key": ["Often"]}, "borrow_weight": 0.8},
+                                    "SYML": {"scales": ["major"]}}}).tables
+        self.assertEqual(tables["style_scales"]["New"], ["major"])
+        self.assertEqual(tables["artist_extensions_data"]["New"], ["maj7"])
+        self.assertEqual(tables["artist_borrowed_chords_data"]["New"], {"major_key": ["Often"], "minor_key": []})
+        self.assertEqual(tables["artist_borrow_weights"]["New"], 0.8)
+        # An artists entry replaces the artist, weight included
+        self.assertNotIn("SYML", tables["artist_borrow_weights"])
+
+class CacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.dir.name, "cache")
+        self.compiles = 0
+        compile_tables = registry.compile_tables
+
+        def counting(tables):
+            self.compiles += 1
+            return compile_tables(tables)
+        patcher = mock.patch.object(registry, "compile_tables", counting)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.dir.cleanup)
+        self.addCleanup(lambda: registry.load_registry().install())
+
+    def write_profile(self, name, profile):
+        path = os.path.join(self.dir.name, name)
+        with open(path, "w") as f:
+            json.dump(profile, f)
+        return path
+
+    def load(self, path):
+        return registry.load_registry(path, cache_dir=self.cache_dir)
+
+    def test_reused_until_content_changes(self):
+        path = self.write_profile("a.json", {"artists": {"A": {"scales": ["major"]}}})
+        self.load(path)
+        self.load(path)
+        self.assertEqual(self.compiles, 1)
+
+        os.utime(path, ns=(0, 0))  # same content, new mtime: the hash still matches
+        self.load(path)
+        self.assertEqual(self.compiles, 1)
+
+        self.write_profile("a.json", {"artists": {"A": {"scales": ["dorian"]}}})
+        self.assertEqual(self.load(path).tables["style_scales"]["A"], ["dorian"])
+        self.assertEqual(self.compiles, 2)
+
+    def test_rebuilt_when_builtin_tables_change(self):
+        path = self.write_profile("a.json", {"artists": {"A": {"scales": ["major"]}}})
+        self.load(path)
+        with mock.patch.object(registry, "builtin_digest", lambda: "changed"):
+            self.load(path)
+        self.assertEqual(self.compiles, 2)
+
+    def test_install_does_not_leak_into_other_profiles(self):
+        a = self.write_profile("a.json", {"artists": {"A": {"scales": ["major"]}}})
+        b = self.write_profile("b.json", {"artists": {"B": {"scales": ["major"]}}})
+        self.load(a).install()
+        self.assertIn("A", core.style_scales)
+        self.assertNotIn("A", self.load(b).tables["style_scales"])
+        self.load(a)
+        self.assertEqual(self.compiles, 2)  # a's cache entry survived installing it
+
+if __name__ == "__main__":
+    unittest.main()